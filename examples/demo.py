@@ -36,7 +36,7 @@ class DemoPlugin(BasePlugin):
         self._widget = DemoWidget()
 
     def widget(self, parent: Optional[QWidget] = None) -> Optional[QMainWindow]:
-        if parent:
+        if parent and self._widget.parent() is not parent:
             self._widget.setParent(parent)
 
         return self._widget
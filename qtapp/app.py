@@ -1,9 +1,10 @@
 import signal
 import sys
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Any, Callable, Iterable, Optional, Sequence
 
-from PySide6.QtCore import QSize, Qt
+from PySide6.QtCore import QSize, Qt, QTimer, Slot
 from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import (
     QApplication,
@@ -21,7 +22,6 @@ from qtapp.common.widgets import (
     NavigationBar,
     NavigationBarButton,
     StatusBar,
-    StatusBarButton,
 )
 from qtapp.docks import BaseDock
 from qtapp.docks.services import DockService
@@ -35,6 +35,43 @@ from qtapp.utils.registrable import Registrable
 _DEFAULT_ORGANIZATION_NAME = "qtapp"
 _DEFAULT_APPLICATION_NAME = "qtapp"
 _DEFAULT_APPLICATION_SIZE = QSize(1000, 600)
+_STYLE_SHEET = Path(__file__).parent.joinpath("style.qss")
+
+# A service method adding a Registrable, e.g. DockService.addDock.
+_Registrar = Callable[[Registrable], None]
+
+# Content of already read style sheets by path, along with their modification
+# time at reading.
+_styleSheetCache: dict[Path, tuple[float, str]] = {}
+
+
+def _readStyleSheet(path: Path) -> str:
+    """Read a style sheet and cache its content.
+
+    The file is only read again if it was modified in the meantime.
+
+    Args:
+        path (Path): The path to the style sheet.
+
+    Returns:
+        str: The content of the style sheet or an empty string if it can't be
+            read.
+    """
+
+    path = Path(path)
+    try:
+        mtime = path.stat().st_mtime
+        cached = _styleSheetCache.get(path, None)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        content = utils.readFileContent(path)
+    except OSError:
+        # A missing style sheet doesn't prevent the application from starting.
+        return ""
+
+    _styleSheetCache[path] = (mtime, content)
+    return content
 
 
 class BaseApplication:
@@ -78,7 +115,13 @@ class BaseApplication:
         self.settingService.addSetting(EnabledExtensionsSetting(self.settingService))
 
         self.dockService = DockService()
-        self.fileService = FileService(self.settingService)
+
+        # Services that handle Registrables by their base class.
+        self._registrars: tuple[tuple[type, _Registrar], ...] = (
+            (BaseDock, self.dockService.addDock),
+            (BaseSetting, self.settingService.addSetting),
+        )
+        self._registrarsByType: dict[type, tuple[_Registrar, ...]] = {}
 
         self._mainWindow = _MainWindow(self)
 
@@ -94,14 +137,24 @@ class BaseApplication:
     def mainWindow(self) -> QMainWindow:
         return self._mainWindow
 
+    @cached_property
+    def fileService(self) -> FileService:
+        """The FileService of the application.
+
+        The service is created on first access, because it sets up a
+        QFileDialog, which isn't needed by every application.
+
+        Returns:
+            FileService: The FileService of the application.
+        """
+
+        return FileService(self.settingService)
+
     def run(self) -> None:
-        plugins: list[BasePlugin] = list(self.pluginService.plugins().values())
-        plugins.sort(key=lambda p: p.priority)
-        for plugin in plugins:
-            self._mainWindow.addPlugin(plugin)
+        self._mainWindow.addPlugins(self.pluginService.orderedPlugins())
 
-        selectedPlugin = self.settingService.value(
-            "application/selectedPlugin", None, str
+        selectedPlugin = self._mainWindow.applicationSettings.get(
+            "selectedPlugin", None
         )
         if not selectedPlugin or not self.navigate(selectedPlugin, animate=False):
             actions = self._mainWindow._navBar.actions()
@@ -124,10 +177,19 @@ class BaseApplication:
 
     def handleRegistrable(self, registrable: Registrable) -> None:
         cls = type(registrable)
-        if issubclass(cls, BaseDock):
-            self.dockService.addDock(registrable)
-        if issubclass(cls, BaseSetting):
-            self.settingService.addSetting(registrable)
+
+        # Resolve the services only once for every Registrable class.
+        registrars = self._registrarsByType.get(cls, None)
+        if registrars is None:
+            registrars = tuple(
+                registrar
+                for baseCls, registrar in self._registrars
+                if issubclass(cls, baseCls)
+            )
+            self._registrarsByType[cls] = registrars
+
+        for registrar in registrars:
+            registrar(registrable)
 
     def navigate(self, pluginId: str, animate: Optional[bool] = True) -> bool:
         """Navigate to the given plugin and select it.
@@ -140,7 +202,7 @@ class BaseApplication:
         """
 
         plugin = self.pluginService.plugins().get(pluginId, None)
-        self._mainWindow.setCurrentPlugin(plugin, animate)
+        return self._mainWindow.setCurrentPlugin(plugin, animate)
 
     def setCurrentDock(self, dockId: str) -> None:
         """Open the dock with the specific ID in the UI.
@@ -168,19 +230,14 @@ class BaseApplication:
             pass
 
     def _setGlobalStyle(self) -> None:
-        sheet = utils.readFileContent(Path(__file__).parent.joinpath("style.qss"))
+        sheets = [_readStyleSheet(_STYLE_SHEET)]
         if self._styleSheet:
-            customSheet = utils.readFileContent(self._styleSheet)
-            sheet += customSheet
+            sheets.append(_readStyleSheet(self._styleSheet))
 
-        self._app.setStyleSheet(sheet)
+        self._app.setStyleSheet("".join(sheets))
 
     def _showMainWindow(self) -> None:
-        maximized = self.settingService.value(
-            "application/maximized",
-            False,
-            bool,
-        )
+        maximized = self._mainWindow.applicationSettings.get("maximized", False)
         if maximized:
             self._mainWindow.showMaximized()
         else:
@@ -195,11 +252,28 @@ class _MainWindow(QMainWindow):
         self._selectedPlugin: BasePlugin = None
 
         self._currentDock: QDockWidget = None
-        self._dockBtns: dict[str, StatusBarButton] = {}
+        self._switchingDock = False
+
+        # Read all application settings at once on startup.
+        self._settings = app.settingService.readGroup(
+            "application",
+            {"size": QSize, "maximized": bool, "selectedPlugin": str},
+        )
 
         self.setupUi()
         self._applySettings()
 
+    @property
+    def applicationSettings(self) -> dict[str, Any]:
+        """Get the application settings read on startup.
+
+        Returns:
+            dict[str, Any]: The values of the settings in the "application"
+                group by their key relative to the group.
+        """
+
+        return self._settings
+
     def setupUi(self) -> None:
         # Prevent showing a context menu to hide ToolBars on right click.
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.NoContextMenu)
@@ -227,17 +301,8 @@ class _MainWindow(QMainWindow):
         self.setCentralWidget(centralWidget)
 
     def _applySettings(self) -> None:
-        settings = self._app.settingService
-        size = settings.value(
-            "application/size",
-            self._app._applicationSize,
-            QSize,
-        )
-        maximized = settings.value(
-            "application/maximized",
-            False,
-            bool,
-        )
+        size = self._settings.get("size", self._app._applicationSize)
+        maximized = self._settings.get("maximized", False)
         if maximized:
             size = self._app._applicationSize
 
@@ -246,23 +311,36 @@ class _MainWindow(QMainWindow):
     def closeEvent(self, event: QCloseEvent) -> None:
         """Overwrite from QMainWindow."""
 
-        settings = self._app.settingService
-        settings.setValue("application/size", self.size())
-        settings.setValue("application/maximized", self.isMaximized())
+        self._app.settingService.writeGroup(
+            "application",
+            {"size": self.size(), "maximized": self.isMaximized()},
+        )
 
         event.accept()
 
     def addPlugin(self, plugin: BasePlugin) -> None:
-        widget = plugin.widget(self)
-        navBarBtn = plugin.navigationBarButton()
-        if not widget or not navBarBtn:
-            return
+        self.addPlugins([plugin])
+
+    def addPlugins(self, plugins: Iterable[BasePlugin]) -> None:
+        navBarBtns: list[NavigationBarButton] = []
+        for plugin in plugins:
+            widget = plugin.widget(self)
+            navBarBtn = plugin.navigationBarButton()
+            if not widget or not navBarBtn:
+                continue
 
-        widget.setContextMenuPolicy(Qt.ContextMenuPolicy.NoContextMenu)
-        self._stack.addWidget(widget)
+            if widget.contextMenuPolicy() != Qt.ContextMenuPolicy.NoContextMenu:
+                widget.setContextMenuPolicy(Qt.ContextMenuPolicy.NoContextMenu)
+            self._stack.addWidget(widget)
 
-        self._navBar.addButton(navBarBtn)
-        navBarBtn.clicked.connect(lambda: self._stack.setCurrentWidget(widget))
+            # The button holds its widget, so all buttons share a single slot.
+            navBarBtn.setProperty("pluginWidget", widget)
+            navBarBtn.clicked.connect(self._onNavigationBarButtonClicked)
+            navBarBtns.append(navBarBtn)
+
+        # Add the buttons of all plugins at once, so the NavigationBar is
+        # only updated once.
+        self._navBar.addButtons(navBarBtns)
 
     def addDock(self, dock: BaseDock) -> None:
         statusBarBtn = dock.statusBarButton()
@@ -270,7 +348,6 @@ class _MainWindow(QMainWindow):
             return
 
         self._statusBar.addButton(statusBarBtn)
-        self._dockBtns[dock.id] = statusBarBtn
 
         widget = dock.widget(self)
         if not widget:
@@ -281,17 +358,53 @@ class _MainWindow(QMainWindow):
         widget.setFeatures(QDockWidget.DockWidgetFeature.DockWidgetClosable)
         widget.setVisible(False)
 
-        def _onVisibilityChanged(visible: bool):
-            if not visible and self._currentDock == widget:
-                self.setCurrentDockWidget(None)
-
-        widget.visibilityChanged.connect(_onVisibilityChanged)
+        widget.visibilityChanged.connect(self._onDockVisibilityChanged)
 
         # A click on the button causes to open the associated QDockWidget.
-        statusBarBtn.clicked.connect(lambda: self.setCurrentDockWidget(widget))
+        statusBarBtn.setProperty("dockWidget", widget)
+        statusBarBtn.clicked.connect(self._onStatusBarButtonClicked)
 
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, widget)
 
+    @Slot()
+    def _onNavigationBarButtonClicked(self) -> None:
+        """Slot triggered when a NavigationBarButton is clicked.
+
+        Shows the widget of the Plugin associated with the button. The widget
+        is switched on the next event loop iteration, so the button can finish
+        its click first.
+        """
+
+        widget = self.sender().property("pluginWidget")
+        if widget is self._stack.currentWidget():
+            return
+
+        QTimer.singleShot(0, partial(self._stack.setCurrentWidget, widget))
+
+    @Slot()
+    def _onStatusBarButtonClicked(self) -> None:
+        """Slot triggered when a StatusBarButton is clicked.
+
+        Opens the QDockWidget associated with the button.
+        """
+
+        self.setCurrentDockWidget(self.sender().property("dockWidget"))
+
+    @Slot(bool)
+    def _onDockVisibilityChanged(self, visible: bool) -> None:
+        """Slot triggered when the visibility of a QDockWidget changes.
+
+        Args:
+            visible (bool): True if the QDockWidget became visible, False
+                otherwise.
+        """
+
+        if self._switchingDock:
+            return
+
+        if not visible and self._currentDock is self.sender():
+            self.setCurrentDockWidget(None)
+
     def setCurrentPlugin(self, plugin: BasePlugin, animate: bool = True) -> bool:
         if not plugin:
             return False
@@ -300,6 +413,12 @@ class _MainWindow(QMainWindow):
         if not button:
             return False
 
+        # The NavigationBarButtons are exclusive, thus a checked button
+        # belongs to the current Plugin. Don't click it again.
+        if button.isChecked():
+            self._selectedPlugin = plugin
+            return True
+
         button.animateClick() if animate else button.click()
         self._selectedPlugin = plugin
         return True
@@ -311,10 +430,17 @@ class _MainWindow(QMainWindow):
             dock (QDockWidget): The dock widget to set.
         """
 
-        if self._currentDock is not None:
-            self._currentDock.setVisible(False)
+        # Hiding the current dock widget reenters this method via its
+        # visibilityChanged Signal. The Signals of the dock widgets aren't
+        # blocked, as others may listen to them as well.
+        self._switchingDock = True
+        try:
+            if self._currentDock is not None:
+                self._currentDock.setVisible(False)
 
-        if dock is not None:
-            dock.setVisible(True)
+            if dock is not None:
+                dock.setVisible(True)
+        finally:
+            self._switchingDock = False
 
         self._currentDock = dock
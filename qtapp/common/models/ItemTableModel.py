@@ -1,4 +1,5 @@
-from typing import Any, Generic, Optional, Sequence, TypeVar
+from bisect import bisect_left
+from typing import Any, Callable, Generic, Hashable, Optional, Sequence, TypeVar
 
 from PySide6.QtCore import (
     QAbstractTableModel,
@@ -11,6 +12,13 @@ from PySide6.QtCore import (
 
 T = TypeVar("T")
 
+# Enum members resolved once, as views query headerData and data for every
+# visible cell on each repaint.
+_ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_TEXT_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_HORIZONTAL = Qt.Orientation.Horizontal
+
 
 class ItemTableModel(QAbstractTableModel, Generic[T]):
     """Custom QAbstractTableModel for displaying items.
@@ -20,11 +28,19 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
     pointer addresses but the objects content by default. Otherwise, it is
     highly recommended to overwrite the 'isPresent' method.
 
+    The model keeps an index mapping each hashable item to its row, so
+    membership tests and row lookups for them don't have to scan the list of
+    items. Unhashable items are compared by equality as before.
+
     Signals:
         itemAdded: This Signal is emitted whenever an item is added to the
             model. It provides the added item.
+        itemsAdded: This Signal is emitted once whenever multiple items are
+            added to the model at once. It provides the list of added items.
         itemRemoved: This Signal is emitted whenever an item gets removed from
             the model. It provides the removed item.
+
+        All Signals are emitted after the rows of the model have been updated.
     """
 
     ItemRole = Qt.ItemDataRole.UserRole + 1
@@ -32,6 +48,7 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
     ensured that it always returns the item data object."""
 
     itemAdded = Signal(object)
+    itemsAdded = Signal(list)
     itemRemoved = Signal(object)
 
     def __init__(
@@ -50,16 +67,26 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
         super().__init__(parent)
         self._headers = headers
         self._items: list[T] = []
+        self._index: dict[Hashable, int] = {}
+
+        # Functions returning the data of an item by role. Each function gets
+        # the item and its index.
+        self._roleHandlers: dict[int, Callable[[T, QModelIndex], Any]] = {
+            ItemTableModel.ItemRole: lambda item, index: item,
+        }
 
     @property
     def items(self) -> list[T]:
         """Get the list of items.
 
+        The list is a copy, so changing it doesn't affect the model. Use the
+        methods of the model to change the items.
+
         Returns:
             list[T]: The list of items.
         """
 
-        return self._items
+        return list(self._items)
 
     def isPresent(self, item: T) -> bool:
         """Check if an item is present in the table.
@@ -75,22 +102,32 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
             bool: True if the item is present, False otherwise.
         """
 
-        return item in self.items
+        return self.indexOf(item) > -1
 
     def setItems(self, items: list[T]) -> None:
         """Set the list of items for the table.
 
-        This method emits the dataChanged Signal, but not the itemAdded
-        or itemRemoved Signal.
+        This method resets the model, but doesn't emit the itemAdded or
+        itemRemoved Signal.
+
+        If the items are equal to the current items, the model takes them
+        without a reset, so attached views keep their state.
 
         Args:
             items (list[T]): The list of items.
         """
 
+        # The model keeps its own copy of the list. Equal items may be
+        # different objects, so the index is still rebuilt.
+        if items == self._items:
+            self._items = list(items)
+            self._rebuildIndex()
+            return
+
         self.beginResetModel()
-        self._items = items
+        self._items = list(items)
+        self._rebuildIndex()
         self.endResetModel()
-        self.dataChanged.emit(0, self.rowCount())
 
     def appendItem(self, item: T) -> bool:
         """Append an item to the end of the model.
@@ -107,12 +144,70 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
             return False
 
         self.beginInsertRows(QModelIndex(), self.rowCount(), self.rowCount())
-        self.items.append(item)
-        self.itemAdded.emit(item)
+        self._items.append(item)
+        self._addToIndex(item, len(self._items) - 1)
         self.endInsertRows()
-        self.dataChanged.emit(self.rowCount(), self.rowCount())
+        self.itemAdded.emit(item)
         return True
 
+    def appendItems(self, items: Sequence[T]) -> int:
+        """Append multiple items to the end of the model at once.
+
+        Items that are already present are skipped. All remaining items are
+        inserted in one operation, so attached views are only notified once.
+
+        Args:
+            items (Sequence[T]): The items to add.
+
+        Returns:
+            int: The number of items that were added.
+        """
+
+        return self.insertItems(self.rowCount(), items)
+
+    def insertItems(self, row: int, items: Sequence[T]) -> int:
+        """Insert multiple items at a specific row of the model at once.
+
+        Items that are already present are skipped. All remaining items are
+        inserted in one operation, so attached views are only notified once.
+
+        Args:
+            row (int): The row index to insert the items.
+            items (Sequence[T]): The items to add.
+
+        Returns:
+            int: The number of items that were added.
+        """
+
+        row = min(row, self.rowCount())
+
+        newItems: list[T] = []
+        for item in items:
+            if self.isPresent(item):
+                continue
+
+            # Reserve the row, so duplicates within the items are skipped.
+            # Unhashable items can't be reserved and are compared directly.
+            if not self._addToIndex(item, row + len(newItems)):
+                if item in newItems:
+                    continue
+            newItems.append(item)
+
+        if not newItems:
+            return 0
+
+        self.beginInsertRows(QModelIndex(), row, row + len(newItems) - 1)
+        self._items[row:row] = newItems
+        if row + len(newItems) < len(self._items):
+            self._rebuildIndex(row)
+        self.endInsertRows()
+
+        for item in newItems:
+            self.itemAdded.emit(item)
+        self.itemsAdded.emit(newItems)
+
+        return len(newItems)
+
     def insertItem(self, row: int, item: T) -> bool:
         """Insert an item at a specific row of the model.
 
@@ -128,11 +223,85 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
         if self.isPresent(item):
             return False
 
+        # Inserting at or behind the end is an append, which neither shifts
+        # any items nor their rows in the index.
+        if row >= self.rowCount():
+            return self.appendItem(item)
+
         self.beginInsertRows(QModelIndex(), row, row)
-        self.items.insert(row, item)
-        self.itemAdded.emit(item)
+        self._items.insert(row, item)
+        self._rebuildIndex(row)
         self.endInsertRows()
-        self.dataChanged.emit(row, row)
+        self.itemAdded.emit(item)
+        return True
+
+    def moveItems(self, row: int, items: Sequence[T]) -> bool:
+        """Move items of the model in front of a specific row.
+
+        The items keep the given order at their new position. Items that are
+        not present are skipped. Contiguous items are moved in one operation,
+        otherwise the layout of the model changes once.
+
+        Args:
+            row (int): The row index in front of which the items are moved.
+            items (Sequence[T]): The items to move.
+
+        Returns:
+            bool: True if the items were moved, False if no item was found or
+                the items are already at the row.
+        """
+
+        rows: list[int] = []
+        moving: set[int] = set()
+        for item in items:
+            source = self.indexOf(item)
+            if source > -1 and source not in moving:
+                moving.add(source)
+                rows.append(source)
+
+        if not rows:
+            return False
+
+        row = max(0, min(row, self.rowCount()))
+        first, last = rows[0], rows[-1]
+        if rows == list(range(first, last + 1)):
+            if first <= row <= last + 1:
+                return False
+
+            self.beginMoveRows(QModelIndex(), first, last, QModelIndex(), row)
+            movingItems = self._items[first : last + 1]
+            del self._items[first : last + 1]
+            dest = row - len(movingItems) if row > last else row
+            self._items[dest:dest] = movingItems
+            self._rebuildIndex(min(first, dest), max(last + 1, row))
+            self.endMoveRows()
+            return True
+
+        # The items are scattered over the model. Reorder the items at once
+        # and move the persistent indexes to the new rows. Only the rows
+        # between the first moved item or the row and the last moved item or
+        # the row change, all other items keep their rows.
+        self.layoutAboutToBeChanged.emit()
+
+        start = min(min(moving), row)
+        stop = max(max(moving) + 1, row)
+        remaining = [other for other in range(start, stop) if other not in moving]
+        position = bisect_left(remaining, row)
+        order = remaining[:position] + rows + remaining[position:]
+        self._items[start:stop] = [self._items[source] for source in order]
+        self._rebuildIndex(start, stop)
+
+        newRows = {source: start + offset for offset, source in enumerate(order)}
+        persistentIndexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistentIndexes,
+            [
+                self.index(newRows.get(index.row(), index.row()), index.column())
+                for index in persistentIndexes
+            ],
+        )
+
+        self.layoutChanged.emit()
         return True
 
     def removeItem(self, item: T) -> bool:
@@ -146,14 +315,80 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
                 was not found.
         """
 
-        if item not in self.items:
+        row = self.indexOf(item)
+        if row < 0:
             return False
 
-        self.beginRemoveRows(QModelIndex(), 0, self.rowCount())
-        self.items.remove(item)
-        self.itemRemoved.emit(item)
+        self._removeFromIndex(self._items[row])
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._items.pop(row)
+        self._rebuildIndex(row)
         self.endRemoveRows()
-        self.dataChanged.emit(0, self.rowCount())
+        self.itemRemoved.emit(item)
+        return True
+
+    def removeItems(self, items: Sequence[T]) -> int:
+        """Remove multiple items from the model at once.
+
+        Items that are not present are skipped. Items in contiguous rows are
+        removed in one operation, so attached views are only notified once per
+        run of rows instead of once per item.
+
+        Args:
+            items (Sequence[T]): The items to remove.
+
+        Returns:
+            int: The number of items that were removed.
+        """
+
+        rows = sorted({row for row in map(self.indexOf, items) if row > -1})
+        if not rows:
+            return 0
+
+        removedItems = [self._items[row] for row in rows]
+
+        # Remove the runs from the back, so the rows of the runs in front stay
+        # valid. The index is updated before each run is reported as removed,
+        # so slots connected to rowsRemoved see the current rows.
+        stop = len(rows)
+        for position in range(len(rows) - 1, -1, -1):
+            if position > 0 and rows[position - 1] == rows[position] - 1:
+                continue
+
+            first, last = rows[position], rows[stop - 1]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for item in self._items[first : last + 1]:
+                self._removeFromIndex(item)
+            del self._items[first : last + 1]
+            self._rebuildIndex(first)
+            self.endRemoveRows()
+            stop = position
+
+        for item in removedItems:
+            self.itemRemoved.emit(item)
+
+        return len(removedItems)
+
+    def replaceItem(self, row: int, item: T) -> bool:
+        """Replace the item at a specific row of the model.
+
+        Args:
+            row (int): The row index of the item to replace.
+            item (T): The new item.
+
+        Returns:
+            bool: True if the item was replaced, False if the row is invalid.
+        """
+
+        if not 0 <= row < len(self._items):
+            return False
+
+        self._removeFromIndex(self._items[row])
+        self._items[row] = item
+        self._addToIndex(item, row)
+
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, self.index(row, self.columnCount() - 1))
         return True
 
     def item(self, index: QModelIndex) -> T:
@@ -182,11 +417,87 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
                 found, -1 is returned.
         """
 
-        for index, value in enumerate(self.items):
-            if value == item:
-                return index
+        try:
+            row = self._index.get(item, None)
+        except TypeError:
+            # Unhashable items aren't indexed and are compared by equality.
+            for index, value in enumerate(self._items):
+                if value == item:
+                    return index
+            return -1
+
+        return row if row is not None else -1
 
-        return -1
+    def _addToIndex(self, item: T, row: int) -> bool:
+        """Add an item to the row index, if it is hashable.
+
+        Args:
+            item (T): The item.
+            row (int): The row of the item.
+
+        Returns:
+            bool: True if the item was indexed, False if it is unhashable.
+        """
+
+        try:
+            self._index[item] = row
+        except TypeError:
+            return False
+
+        return True
+
+    def _removeFromIndex(self, item: T) -> None:
+        """Remove an item from the row index, if it is hashable.
+
+        Args:
+            item (T): The item.
+        """
+
+        try:
+            self._index.pop(item, None)
+        except TypeError:
+            pass
+
+    def _rebuildIndex(self, start: int = 0, stop: Optional[int] = None) -> None:
+        """Update the row index for all items starting at a specific row.
+
+        Must be called whenever rows are inserted or removed in the middle of
+        the list of items, because the rows of all following items change.
+
+        Args:
+            start (int): The first row to update (default = 0).
+            stop (Optional[int]): The row after the last row to update. If
+                None, all rows up to the end are updated (default = None).
+        """
+
+        if stop is None:
+            stop = len(self._items)
+            if start == 0:
+                self._index.clear()
+
+        # Iterate backwards to keep the first occurrence if the same item is
+        # present twice.
+        for row in range(stop - 1, start - 1, -1):
+            self._addToIndex(self._items[row], row)
+
+    def registerRole(
+        self,
+        role: int,
+        handler: Callable[[T, QModelIndex], Any],
+    ) -> None:
+        """Register a function returning the data of an item for a role.
+
+        This allows subclasses to provide data for additional roles without
+        overwriting the data method. A handler registered for an already
+        registered role replaces the previous one.
+
+        Args:
+            role (int): The role of the data, e.g. Qt.ItemDataRole.ToolTipRole.
+            handler (Callable[[T, QModelIndex], Any]): The function returning
+                the data. It gets the item and its index.
+        """
+
+        self._roleHandlers[role] = handler
 
     def headerData(
         self,
@@ -207,13 +518,13 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
             Any: The header data.
         """
 
-        if role == Qt.ItemDataRole.TextAlignmentRole:
-            return Qt.AlignmentFlag.AlignLeft
+        if role == _TEXT_ALIGNMENT_ROLE:
+            return _ALIGN_LEFT
 
-        if role != Qt.ItemDataRole.DisplayRole:
+        if role != _DISPLAY_ROLE:
             return None
 
-        if orientation == Qt.Orientation.Horizontal:
+        if orientation == _HORIZONTAL:
             return self._headers[section]
 
     def data(
@@ -233,14 +544,11 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
             Any: The data for the specified index and role.
         """
 
-        if not index.isValid():
+        handler = self._roleHandlers.get(role, None)
+        if handler is None or not index.isValid():
             return None
 
-        item: T = self.items[index.row()]
-        if role == ItemTableModel.ItemRole:
-            return item
-
-        return None
+        return handler(self._items[index.row()], index)
 
     def rowCount(self, index=QModelIndex()) -> int:
         """Override from QAbstractItemModel.
@@ -254,7 +562,7 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
             int: The number of rows in the model.
         """
 
-        return len(self.items)
+        return len(self._items)
 
     def columnCount(self, index=QModelIndex()) -> int:
         """Override from QAbstractItemModel.
@@ -274,12 +582,13 @@ class ItemTableModel(QAbstractTableModel, Generic[T]):
 class ItemMimeData(QMimeData):
     """A custom QMimeData class which holds a list of items.
 
-    An item can be any Python object.
+    An item can be any Python object. The items are stored as a tuple, so
+    the dragged items can't change while the drag is in progress.
 
     Args:
-        items (list[Any]): The list of items.
+        items (Sequence[Any]): The sequence of items.
     """
 
-    def __init__(self, items: list[Any]) -> None:
+    def __init__(self, items: Sequence[Any]) -> None:
         super().__init__()
-        self._items = items
+        self._items: tuple[Any, ...] = tuple(items)
@@ -1,4 +1,4 @@
-from typing import Any, Optional, Self, Union
+from typing import Any, Callable, Optional, Self, Union
 
 from PySide6.QtCore import (
     QAbstractItemModel,
@@ -9,10 +9,34 @@ from PySide6.QtCore import (
     Qt,
 )
 
+# Enum members resolved once, as views query data for every visible cell on
+# each repaint.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_EDIT_ROLE = Qt.ItemDataRole.EditRole
+
+# Tags for the kind of value of an item. Comparing small integers is cheaper
+# than comparing type objects.
+_LEAF = 0
+_DICT = 1
+_LIST = 2
+
 
 class _JsonTreeItem:
     """A item corresponding to a line in QTreeView."""
 
+    # A JSON document can have a lot of items, so don't create an instance
+    # dictionary for each of them.
+    __slots__ = (
+        "_parent",
+        "_key",
+        "_value",
+        "_valueType",
+        "_children",
+        "_row",
+        "_foldedKey",
+        "_foldedValue",
+    )
+
     def __init__(self, parent: Optional[Self] = None) -> None:
         """Initialize the _JsonTreeItem.
 
@@ -24,8 +48,16 @@ class _JsonTreeItem:
         self._parent = parent
         self._key = ""
         self._value = ""
-        self._valueType = None
-        self._children = []
+        self._valueType = _LEAF
+        self._children: Union[list[Self], tuple[Self, ...]] = []
+
+        # The row in the parent, set when the item is appended to the parent.
+        self._row = 0
+
+        # The lowercase strings of the key and value used by case insensitive
+        # searches. Created on first use and reset whenever they change.
+        self._foldedKey: Optional[str] = None
+        self._foldedValue: Optional[str] = None
 
     @property
     def key(self) -> str:
@@ -46,6 +78,7 @@ class _JsonTreeItem:
         """
 
         self._key = key
+        self._foldedKey = None
 
     @property
     def value(self) -> str:
@@ -66,33 +99,67 @@ class _JsonTreeItem:
         """
 
         self._value = value
+        self._foldedValue = None
 
     @property
-    def valueType(self) -> None:
-        """Get the Python type of the item's value.
+    def valueType(self) -> int:
+        """Get the kind of the item's value.
 
         Returns:
-            value_type (type): The Python type of the item's value.
+            value_type (int): _DICT or _LIST if the item's value is a dict or
+                list, _LEAF otherwise.
         """
 
         return self._valueType
 
     @valueType.setter
-    def valueType(self, value):
-        """Set the Python type of the item's value.
+    def valueType(self, value: Union[int, type]):
+        """Set the kind of the item's value.
 
         Args:
-            value_type (type): The Python type of the item's value.
+            value_type (Union[int, type]): The kind of the item's value. A
+                Python type is converted to the corresponding kind.
         """
+
+        if isinstance(value, type):
+            value = _DICT if value is dict else _LIST if value is list else _LEAF
+
         self._valueType = value
 
+    def foldedKey(self) -> str:
+        """Get the lowercase string of the key name.
+
+        Returns:
+            str: The lowercase key name.
+        """
+
+        if self._foldedKey is None:
+            self._foldedKey = str(self._key).lower()
+
+        return self._foldedKey
+
+    def foldedValue(self) -> str:
+        """Get the lowercase string of the value of the current item.
+
+        Returns:
+            str: The lowercase value.
+        """
+
+        if self._foldedValue is None:
+            self._foldedValue = str(self._value).lower()
+
+        return self._foldedValue
+
     def appendChild(self, item: Self):
         """Add an item as a child.
 
+        Only used while building the tree, the children are frozen afterwards.
+
         Args:
             item (_JsonTreeItem): The child item to add.
         """
 
+        item._row = len(self._children)
         self._children.append(item)
 
     def child(self, row: int) -> Self:
@@ -123,7 +190,7 @@ class _JsonTreeItem:
             int: The row index of the current item in the parent.
         """
 
-        return self._parent._children.index(self) if self._parent else 0
+        return self._row
 
     def childCount(self) -> int:
         """Get the number of children of the current item.
@@ -149,7 +216,8 @@ class _JsonTreeItem:
                 data = json.dump(file)
                 root = _JsonTreeItem.load(data)
 
-        This method is a recursive function that calls itself.
+        The tree is built iteratively, so deeply nested documents don't hit
+        the recursion limit.
 
         Returns:
             _JsonTreeItem: A _JsonTreeItem.
@@ -158,25 +226,31 @@ class _JsonTreeItem:
         rootItem = _JsonTreeItem(parent)
         rootItem.key = "root"
 
-        if isinstance(value, dict):
-            items = sorted(value.items()) if sort else value.items()
+        # Items whose value still has to be loaded, along with the value.
+        stack: list[tuple[_JsonTreeItem, Any]] = [(rootItem, value)]
+        while stack:
+            item, value = stack.pop()
 
-            for key, value in items:
-                child = cls.load(value, rootItem)
-                child.key = key
-                child.valueType = type(value)
-                rootItem.appendChild(child)
+            if isinstance(value, dict):
+                children = sorted(value.items()) if sort else value.items()
+            elif isinstance(value, list):
+                children = enumerate(value)
+            else:
+                item.value = value
+                item.valueType = _LEAF
+                item._children = ()
+                continue
 
-        elif isinstance(value, list):
-            for index, value in enumerate(value):
-                child = cls.load(value, rootItem)
-                child.key = index
-                child.valueType = type(value)
-                rootItem.appendChild(child)
+            for key, childValue in children:
+                child = cls(item)
+                child.key = key
+                child.valueType = _valueTag(childValue)
+                item.appendChild(child)
+                stack.append((child, childValue))
 
-        else:
-            rootItem.value = value
-            rootItem.valueType = type(value)
+            # The children never change after loading. A tuple takes less
+            # memory than the list it was built in.
+            item._children = tuple(item._children)
 
         return rootItem
 
@@ -191,6 +265,17 @@ class JsonModel(QAbstractItemModel):
         self._headers = ["Identifier", "Value"]
         self._indexVisitOrder = []
 
+        # The items in the traversal order. The item at position i belongs to
+        # the indexes at the positions 2 * i (key) and 2 * i + 1 (value) of
+        # the traversal order.
+        self._itemVisitOrder: list[_JsonTreeItem] = []
+
+        # The regular expression of the last search along with its pattern
+        # and options.
+        self._lastRegularExpression: Optional[
+            tuple[tuple[str, QRegularExpression.PatternOption], QRegularExpression]
+        ] = None
+
     def _calculateIndexVisitOrder(self) -> list[QModelIndex]:
         """Calculate the order of index traversal.
 
@@ -199,19 +284,21 @@ class JsonModel(QAbstractItemModel):
                 order.
         """
 
-        rootIndex = self.index(0, 0)
-        result: list[QModelIndex] = [rootIndex]
-
-        index = rootIndex
-        while True:
-            index = self._nextIndex(index)
-
-            # If root is reached again all indexes were visited.
-            if index == rootIndex:
-                break
-
-            result.append(index)
-
+        # Search the tree depth-first and row-wise (key, value).
+        result: list[QModelIndex] = []
+        items = self._itemVisitOrder
+        items.clear()
+        stack: list[_JsonTreeItem] = list(reversed(self._rootItem._children))
+        while stack:
+            item = stack.pop()
+            items.append(item)
+            row = item.row()
+            result.append(self.createIndex(row, 0, item))
+            result.append(self.createIndex(row, 1, item))
+            stack.extend(reversed(item._children))
+
+        # An invalid index marks the end of the traversal.
+        result.append(QModelIndex())
         return result
 
     def beginResetModel(self) -> None:
@@ -219,6 +306,7 @@ class JsonModel(QAbstractItemModel):
 
         super().beginResetModel()
         self._indexVisitOrder.clear()
+        self._itemVisitOrder.clear()
 
     def endResetModel(self) -> None:
         """Override from QAbstractItemModel."""
@@ -247,7 +335,7 @@ class JsonModel(QAbstractItemModel):
 
         self.beginResetModel()
         self._rootItem = _JsonTreeItem.load(document)
-        self._rootItem.valueType = type(document)
+        self._rootItem.valueType = _valueTag(document)
         self.endResetModel()
 
         return True
@@ -297,19 +385,12 @@ class JsonModel(QAbstractItemModel):
         if not index.isValid():
             return None
 
-        item: _JsonTreeItem = index.internalPointer()
+        if role == _DISPLAY_ROLE:
+            item: _JsonTreeItem = index.internalPointer()
+            return item._key if index.column() == 0 else item._value
 
-        if role == Qt.ItemDataRole.DisplayRole:
-            match index.column():
-                case 0:
-                    return item.key
-                case 1:
-                    return item.value
-            return None
-
-        if role == Qt.ItemDataRole.EditRole:
-            if index.column() == 1:
-                return item.value
+        if role == _EDIT_ROLE and index.column() == 1:
+            return index.internalPointer()._value
 
         return None
 
@@ -454,58 +535,81 @@ class JsonModel(QAbstractItemModel):
         wrap = flags & Qt.MatchFlag.MatchWrap == Qt.MatchFlag.MatchWrap
         allHits = hits == -1
 
-        # Regular expressions
-        rx = QRegularExpression()
+        caseInsensitive = cs == Qt.CaseSensitivity.CaseInsensitive
+
+        # Regular expressions. Only created for the match types using them.
+        rx: Optional[QRegularExpression] = None
         if matchType == Qt.MatchFlag.MatchRegularExpression:
             if type(value) == QRegularExpression:
-                rx = value
+                pattern = value.pattern()
+                options = value.patternOptions()
             else:
-                rx.setPattern(str(value))
+                pattern = str(value)
+                options = QRegularExpression.PatternOption.NoPatternOption
+            rx = self._regularExpression(pattern, options, caseInsensitive)
         elif matchType == Qt.MatchFlag.MatchWildcard:
             pattern = QRegularExpression.wildcardToRegularExpression(str(value))
-            rx.setPattern(pattern)
+            options = QRegularExpression.PatternOption.NoPatternOption
+            rx = self._regularExpression(pattern, options, caseInsensitive)
 
-        if cs == Qt.CaseSensitivity.CaseInsensitive:
-            rx.setPatternOptions(QRegularExpression.PatternOption.CaseInsensitiveOption)
+        # Predicate. Dispatch on the match type once instead of for every
+        # index.
+        if matchType == Qt.MatchFlag.MatchExactly:
+            isMatch: Callable[[Any], bool] = lambda v: value == v
+        else:
+            needle = str(value).lower() if caseInsensitive else str(value)
+            match matchType:
+                case Qt.MatchFlag.MatchRegularExpression | Qt.MatchFlag.MatchWildcard:
+                    test: Callable[[str], bool] = lambda t: rx.match(t).hasMatch()
+                case Qt.MatchFlag.MatchStartsWith:
+                    test = lambda t: t.startswith(needle)
+                case Qt.MatchFlag.MatchEndsWith:
+                    test = lambda t: t.endswith(needle)
+                case Qt.MatchFlag.MatchFixedString:
+                    test = lambda t: t == needle
+                case Qt.MatchFlag.MatchContains | _:
+                    test = lambda t: needle in t
+
+            if caseInsensitive:
+                isMatch = lambda v: test(str(v).lower())
+            else:
+                isMatch = lambda v: test(str(v))
 
         # Index range
-        fromIndex = self._indexVisitOrder.index(start)
-        length = len(self._indexVisitOrder)
-        toIndex = length + fromIndex if wrap else length
-
-        # Iteration
-        for index in (self._indexVisitOrder * 2)[fromIndex:toIndex]:
+        order = self._indexVisitOrder
+        fromIndex = order.index(start)
+        length = len(order)
+        count = length if wrap else length - fromIndex
+
+        # Iteration. Walk the visit order as a ring starting at fromIndex.
+        # The displayed data is read from the flat list of items directly
+        # instead of resolving every index through the data method.
+        data = self.data
+        items = self._itemVisitOrder
+        display = role == Qt.ItemDataRole.DisplayRole
+
+        # Case insensitive searches of the displayed data test the cached
+        # lowercase strings of the items, so they are only created once.
+        folded = (
+            display and caseInsensitive and matchType != Qt.MatchFlag.MatchExactly
+        )
+        for i in range(fromIndex, fromIndex + count):
+            i %= length
+            index = order[i]
             if not index.isValid():
                 continue
 
-            v = self.data(index, role)
-            if matchType == Qt.MatchFlag.MatchExactly:
-                if value == v:
-                    result.append(index)
+            if display:
+                item = items[i >> 1]
+                if folded:
+                    matched = test(item.foldedValue() if i & 1 else item.foldedKey())
+                else:
+                    matched = isMatch(item._value if i & 1 else item._key)
             else:
-                value: str = str(value)
-                t: str = str(v)
-                if cs == Qt.CaseSensitivity.CaseInsensitive:
-                    value = value.lower()
-                    t = t.lower()
-                match matchType:
-                    case (
-                        Qt.MatchFlag.MatchRegularExpression | Qt.MatchFlag.MatchWildcard
-                    ):
-                        if rx.match(t).hasMatch():
-                            result.append(index)
-                    case Qt.MatchFlag.MatchStartsWith:
-                        if t.startswith(value):
-                            result.append(index)
-                    case Qt.MatchFlag.MatchEndsWith:
-                        if t.endswith(value):
-                            result.append(index)
-                    case Qt.MatchFlag.MatchFixedString:
-                        if t == value:
-                            result.append(index)
-                    case Qt.MatchFlag.MatchContains | _:
-                        if value in t:
-                            result.append(index)
+                matched = isMatch(data(index, role))
+
+            if matched:
+                result.append(index)
 
             # Check for hits
             if (not allHits) and len(result) >= hits:
@@ -513,44 +617,40 @@ class JsonModel(QAbstractItemModel):
 
         return result
 
-    def _nextIndex(self, current=QModelIndex()) -> QModelIndex:
-        """Return the next index after the given index.
+    def _regularExpression(
+        self,
+        pattern: str,
+        options: QRegularExpression.PatternOption,
+        caseInsensitive: bool,
+    ) -> QRegularExpression:
+        """Get an optimized QRegularExpression for the given pattern.
+
+        The last QRegularExpression is reused if the pattern and options
+        didn't change, as successive searches often use the same pattern.
 
         Args:
-            current (QModelIndex, optional): The current index. Defaults to
-                QModelIndex().
+            pattern (str): The pattern of the regular expression.
+            options (QRegularExpression.PatternOption): The pattern options.
+            caseInsensitive (bool): True if the match is case insensitive.
+                This replaces the given pattern options.
 
         Returns:
-            QModelIndex: The next index.
+            QRegularExpression: The optimized regular expression.
         """
 
-        # If index is invalid return the root index for convenience.
-        if not current.isValid():
-            return self.index(0, 0)
-
-        key_index = current.siblingAtColumn(0)
-        # Search the tree row-wise (key, value).
-        if current.column() < self.columnCount(key_index) - 1:
-            return current.siblingAtColumn(current.column() + 1)
-
-        current = key_index
+        if caseInsensitive:
+            options = QRegularExpression.PatternOption.CaseInsensitiveOption
 
-        # Check if the current item has childs. If the item has childs, return
-        # the index of the first child.
-        if self.hasChildren(current):
-            current_item: _JsonTreeItem = current.internalPointer()
-            child_item = current_item.child(0)
-            return self.createIndex(0, 0, child_item)
+        key = (pattern, options)
+        if self._lastRegularExpression is not None:
+            lastKey, rx = self._lastRegularExpression
+            if lastKey == key:
+                return rx
 
-        # Check if there are items on the same level in the tree
-        while not current == QModelIndex():
-            if current.row() < self.rowCount(current.parent()) - 1:
-                return current.sibling(current.row() + 1, 0)
-
-            current = current.parent()
-
-        # Return an invalid index to mark the end of the list
-        return QModelIndex()
+        rx = QRegularExpression(pattern, options)
+        rx.optimize()
+        self._lastRegularExpression = (key, rx)
+        return rx
 
     def to_dict(self, item: Optional[_JsonTreeItem] = None) -> Any:
         """Converts a _JsonTreeItem and its children to a JSON-compatible data
@@ -564,8 +664,10 @@ class JsonModel(QAbstractItemModel):
             dict or list or Any: The converted JSON data structure.
 
         Notes:
-            This method recursively converts the _JsonTreeItem and its children
-                to a JSON-compatible data structure.
+            This method converts the _JsonTreeItem and its children to a
+                JSON-compatible data structure. The tree is walked
+                iteratively, so deeply nested items don't hit the recursion
+                limit.
             The resulting structure can be a dictionary, a list, or a simple
                 value, depending on the item's value_type.
 
@@ -576,24 +678,30 @@ class JsonModel(QAbstractItemModel):
         if item is None:
             item = self._rootItem
 
-        nchild = item.childCount()
+        document = _emptyContainer(item)
+        if document is None:
+            return item.value
 
-        if item.valueType is dict:
-            document = {}
-            for i in range(nchild):
-                ch = item.child(i)
-                document[ch.key] = self.to_dict(ch)
-            return document
+        # Items whose children still have to be converted, along with the
+        # container to put the children into.
+        stack: list[tuple[_JsonTreeItem, Union[dict, list]]] = [(item, document)]
+        while stack:
+            parent, container = stack.pop()
 
-        elif item.valueType == list:
-            document = []
-            for i in range(nchild):
-                ch = item.child(i)
-                document.append(self.to_dict(ch))
-            return document
+            for i in range(parent.childCount()):
+                ch = parent.child(i)
+                childContainer = _emptyContainer(ch)
+                value = ch.value if childContainer is None else childContainer
 
-        else:
-            return item.value
+                if isinstance(container, dict):
+                    container[ch.key] = value
+                else:
+                    container.append(value)
+
+                if childContainer is not None:
+                    stack.append((ch, childContainer))
+
+        return document
 
     def rowCount(self, parent=QModelIndex()) -> int:
         """Override from QAbstractItemModel.
@@ -632,3 +740,43 @@ class JsonModel(QAbstractItemModel):
         """
 
         return 2
+
+
+def _emptyContainer(item: _JsonTreeItem) -> Optional[Union[dict, list]]:
+    """Create an empty container for the value of a _JsonTreeItem.
+
+    Args:
+        item (_JsonTreeItem): The item.
+
+    Returns:
+        Optional[Union[dict, list]]: An empty dict or list depending on the
+            item's valueType, None if the item holds a simple value.
+    """
+
+    valueType = item.valueType
+    if valueType == _DICT:
+        return {}
+
+    if valueType == _LIST:
+        return []
+
+    return None
+
+
+def _valueTag(value: Any) -> int:
+    """Get the kind of a value of a _JsonTreeItem.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        int: _DICT or _LIST if the value is a dict or list, _LEAF otherwise.
+    """
+
+    if isinstance(value, dict):
+        return _DICT
+
+    if isinstance(value, list):
+        return _LIST
+
+    return _LEAF
@@ -15,6 +15,30 @@ class PathListModel(ItemTableModel[Path]):
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(["Path"], parent)
 
+        # Views query the displayed text on every repaint. Cache the absolute
+        # path string of each Path, as Path.absolute() queries the current
+        # working directory.
+        self._absolutePaths: dict[Path, str] = {}
+        self.itemRemoved.connect(lambda path: self._absolutePaths.pop(path, None))
+        self.modelReset.connect(self._absolutePaths.clear)
+
+    def absolutePath(self, path: Path) -> str:
+        """Get the absolute path string of a Path.
+
+        Args:
+            path (Path): The Path.
+
+        Returns:
+            str: The absolute path string.
+        """
+
+        absolutePath = self._absolutePaths.get(path, None)
+        if absolutePath is None:
+            absolutePath = str(path.absolute())
+            self._absolutePaths[path] = absolutePath
+
+        return absolutePath
+
     def data(
         self,
         index: QModelIndex,
@@ -25,11 +49,11 @@ class PathListModel(ItemTableModel[Path]):
         if not index.isValid():
             return None
 
-        item: Path = self.items[index.row()]
+        item: Path = self._items[index.row()]
         if role in [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole]:
             match index.column():
                 case 0:
-                    return str(item.absolute())
+                    return self.absolutePath(item)
             return None
 
         return super().data(index, role)
@@ -50,9 +74,7 @@ class PathListModel(ItemTableModel[Path]):
             if not path.exists():
                 return False
 
-            self.items[index.row()] = path
-            self.dataChanged.emit(index, index)
-            return True
+            return self.replaceItem(index.row(), path)
 
         return False
 
@@ -74,9 +96,7 @@ class PathListModel(ItemTableModel[Path]):
 
         items = [self.item(index) for index in indexes]
         mimedata = ItemMimeData(items)
-        mimedata.setText(
-            "\n".join([str(index.data(ItemTableModel.ItemRole) for index in indexes)])
-        )
+        mimedata.setText("\n".join(self.absolutePath(item) for item in items))
         mimedata.setParent(self)
         return mimedata
 
@@ -95,24 +115,29 @@ class PathListModel(ItemTableModel[Path]):
 
         dest_row = parent.row() if parent.row() > -1 else self.rowCount()
 
-        # Drop from internal.
+        # Drop from internal. The drop row counts the rows without the moved
+        # items, like removing and reinserting them did. moveItems expects a
+        # row counting all rows, so the moved items in front are added.
         if isinstance(data, ItemMimeData):
             data: ItemMimeData = data
-            for path in data._items:
-                removed = self.removeItem(path)
-                if removed:
-                    self.insertItem(dest_row, path)
+            for source in sorted({self.indexOf(item) for item in data._items}):
+                if -1 < source < dest_row:
                     dest_row += 1
-
+            self.moveItems(dest_row, data._items)
             return True
-        elif not data.hasText():
-            return False
-        # Drop from external.
+
+        # Drop from external. Prefer the URLs parsed by Qt and only fall back
+        # to parsing the text if there are none.
+        if data.hasUrls():
+            paths = [Path(url.toLocalFile()) for url in data.urls()]
+        elif data.hasText():
+            paths = [
+                Path(QUrl(path).toLocalFile())
+                for path in data.text().split("\n")
+                if path
+            ]
         else:
-            paths = data.text().split("\n")
-            for path in paths:
-                if path:
-                    self.insertItem(dest_row, Path(QUrl.toLocalFile(QUrl(path))))
-                    dest_row += 1
+            return False
 
-            return True
+        self.insertItems(dest_row, paths)
+        return True
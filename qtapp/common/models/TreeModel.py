@@ -1,22 +1,64 @@
-from typing import Any, Optional, Self
+from typing import Any, Callable, Optional, Self, Sequence
 
 from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt
-from PySide6.QtGui import QStandardItem
+
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole)
+_EDIT_ROLE = int(Qt.ItemDataRole.EditRole)
+
+# The flags of every valid index. These are the flags of QAbstractItemModel
+# for a valid index, plus editable. Views query the flags for every visible
+# cell, so they are combined once.
+_ITEM_FLAGS = (
+    Qt.ItemFlag.ItemIsEditable
+    | Qt.ItemFlag.ItemIsSelectable
+    | Qt.ItemFlag.ItemIsEnabled
+)
+
+
+def _roleKey(role: Qt.ItemDataRole) -> int:
+    """Get the key of a role in the data of a _TreeItem.
+
+    Like QStandardItem, the edit role shares the data of the display role.
+
+    Args:
+        role (Qt.ItemDataRole): The role.
+
+    Returns:
+        int: The key of the role.
+    """
+
+    role = int(role)
+    return _DISPLAY_ROLE if role == _EDIT_ROLE else role
 
 
 class _TreeItem:
     """Represents an item in a tree structure."""
 
-    def __init__(self, parent: Optional[Self] = None) -> None:
-        self._itemData: list[QStandardItem] = (
-            [QStandardItem() for i in range(parent.columnCount())]
-            if parent is not None
-            else []
-        )
+    # Trees can have a lot of items, so don't create an instance dictionary
+    # for each of them.
+    __slots__ = ("_itemData", "_parentItem", "_childItems", "_row", "_fetchChildren")
+
+    def __init__(
+        self,
+        parent: Optional[Self] = None,
+        columnCount: Optional[int] = None,
+    ) -> None:
+        if columnCount is None:
+            columnCount = parent.columnCount() if parent is not None else 0
+
+        # The data of each column, mapping roles to values.
+        self._itemData: list[dict[int, Any]] = [{} for i in range(columnCount)]
 
         self._parentItem = parent
         self._childItems: list[Self] = []
 
+        # The row in the parent. Views query the parent of indexes very often,
+        # so the row is kept up to date instead of searching the siblings.
+        self._row = 0
+
+        # A function creating the child items once a view needs them.
+        self._fetchChildren: Optional[Callable[[Self], Sequence[Self]]] = None
+
     def child(self, row: int) -> Self:
         """Get the child item at the specified row.
 
@@ -58,7 +100,7 @@ class _TreeItem:
         if column < 0 or column >= len(self._itemData):
             return None
 
-        return self._itemData[column].data(role)
+        return self._itemData[column].get(_roleKey(role), None)
 
     def setData(
         self,
@@ -80,7 +122,7 @@ class _TreeItem:
         if column < 0 or column >= len(self._itemData):
             return False
 
-        self._itemData[column].setData(value, role)
+        self._itemData[column][_roleKey(role)] = value
         return True
 
     def appendChild(self, child: Self) -> None:
@@ -90,14 +132,42 @@ class _TreeItem:
             child (TreeItem): The child item to append.
         """
 
+        child._row = len(self._childItems)
         self._childItems.append(child)
 
-    def insertChildren(self, position: int, count: int) -> bool:
+    def setFetchChildren(
+        self,
+        fetchChildren: Optional[Callable[[Self], Sequence[Self]]],
+    ) -> None:
+        """Set a function creating the child items on demand.
+
+        Instead of building the whole tree upfront, the children of an item
+        can be created once a view needs them, e.g. when the item is
+        expanded. The function is called at most once. It gets this item and
+        returns the new child items, created with this item as their parent.
+
+        Args:
+            fetchChildren (Optional[Callable[[_TreeItem], Sequence[_TreeItem]]]):
+                The function creating the child items. None to remove a
+                previously set function.
+        """
+
+        self._fetchChildren = fetchChildren
+
+    def insertChildren(
+        self,
+        position: int,
+        count: int,
+        columnCount: Optional[int] = None,
+    ) -> bool:
         """Insert an amount of child items at a specific position.
 
         Args:
             position (int): The position to insert.
             count (int): The number of items to insert.
+            columnCount (Optional[int]): The number of columns of the new
+                items. If None, the items get the columns of this item
+                (default = None).
 
         Returns:
             bool: True if the operation was successful, False otherwise.
@@ -106,10 +176,13 @@ class _TreeItem:
         if position < 0 or position > len(self._childItems):
             return False
 
-        for row in range(count):
-            item = _TreeItem(self)
-            self._childItems.insert(position, item)
+        if columnCount is None:
+            columnCount = self.columnCount()
 
+        self._childItems[position:position] = [
+            _TreeItem(self, columnCount) for _ in range(count)
+        ]
+        self._updateRows(position)
         return True
 
     def removeChildren(self, position: int, count: int) -> bool:
@@ -127,11 +200,32 @@ class _TreeItem:
         if position < 0 or position + count > len(self._childItems):
             return False
 
-        for row in range(count):
-            self._childItems.pop(position)
+        removed = self._childItems[position : position + count]
+        del self._childItems[position : position + count]
+        self._updateRows(position)
+
+        # Items and their parents reference each other. Break these cycles,
+        # so the removed items are freed right away by reference counting
+        # instead of piling up until the cyclic garbage collector runs.
+        while removed:
+            item = removed.pop()
+            item._parentItem = None
+            removed.extend(item._childItems)
+            item._childItems = []
 
         return True
 
+    def _updateRows(self, start: int) -> None:
+        """Update the cached rows of the child items starting at a position.
+
+        Args:
+            start (int): The position of the first child item to update.
+        """
+
+        childItems = self._childItems
+        for row in range(start, len(childItems)):
+            childItems[row]._row = row
+
     def childCount(self) -> int:
         """Get the number of child items.
 
@@ -141,15 +235,15 @@ class _TreeItem:
 
         return len(self._childItems)
 
-    def appendColumn(self, item: Optional[QStandardItem] = None) -> None:
+    def appendColumn(self, data: Optional[dict[int, Any]] = None) -> None:
         """Append a column to this item's data.
 
         Args:
-            item (QStandardItem, optional): The item to append as a column.
-                Defaults to None.
+            data (dict[int, Any], optional): The data of the column, mapping
+                roles to values. Defaults to None.
         """
 
-        self._itemData.append(item if item is not None else QStandardItem())
+        self._itemData.append(data if data is not None else {})
 
     def insertColumns(self, position: int, columns: int) -> bool:
         """Insert multiple child items at the specified position.
@@ -166,11 +260,14 @@ class _TreeItem:
         if position < 0 or position > len(self._itemData):
             return False
 
-        for _ in range(columns):
-            self._itemData.insert(position, QStandardItem())
-
-        for child in self._childItems:
-            child.insertColumns(position, columns)
+        # Walk the subtree iteratively, deep trees don't hit the recursion
+        # limit this way.
+        stack: list[_TreeItem] = [self]
+        while stack:
+            item = stack.pop()
+            if position <= len(item._itemData):
+                item._itemData[position:position] = [{} for _ in range(columns)]
+            stack.extend(item._childItems)
 
         return True
 
@@ -189,11 +286,14 @@ class _TreeItem:
         if position < 0 or position + columns > len(self._itemData):
             return False
 
-        for column in range(columns):
-            self._itemData.pop(position)
-
-        for child in self._childItems:
-            child.removeColumns(position, columns)
+        # Walk the subtree iteratively, deep trees don't hit the recursion
+        # limit this way.
+        stack: list[_TreeItem] = [self]
+        while stack:
+            item = stack.pop()
+            if position + columns <= len(item._itemData):
+                del item._itemData[position : position + columns]
+            stack.extend(item._childItems)
 
         return True
 
@@ -223,7 +323,7 @@ class _TreeItem:
         """
 
         if self._parentItem:
-            return self._parentItem._childItems.index(self)
+            return self._row
         return 0
 
 
@@ -242,7 +342,7 @@ class TreeModel(QAbstractItemModel):
 
         self._rootItem = _TreeItem()
         for header in headers:
-            self._rootItem.appendColumn(QStandardItem(header))
+            self._rootItem.appendColumn({_DISPLAY_ROLE: header})
 
     def headerData(
         self,
@@ -329,7 +429,9 @@ class TreeModel(QAbstractItemModel):
         if not index.isValid():
             return None
 
-        item: _TreeItem = self.item(index)
+        # Views call this method for every visible cell, so the item is taken
+        # from the valid index directly instead of going through item().
+        item: _TreeItem = index.internalPointer()
         return item.data(index.column(), role)
 
     def setData(
@@ -353,7 +455,14 @@ class TreeModel(QAbstractItemModel):
         """
 
         item: _TreeItem = self.item(index)
-        result: bool = item.setData(index.column(), value, role)
+        column = index.column()
+
+        # Writing the current value again changes nothing, so attached views
+        # don't have to be notified.
+        if 0 <= column < item.columnCount() and item.data(column, role) == value:
+            return True
+
+        result: bool = item.setData(column, value, role)
 
         if result:
             self.dataChanged.emit(
@@ -383,16 +492,16 @@ class TreeModel(QAbstractItemModel):
                 parent.
         """
 
-        if parent.isValid() and parent.column() != 0:
-            return QModelIndex()
-
-        parent_item: _TreeItem = self.item(parent)
-        if not parent_item:
-            return QModelIndex()
+        if parent.isValid():
+            if parent.column() != 0:
+                return QModelIndex()
+            parentItem: _TreeItem = parent.internalPointer()
+        else:
+            parentItem = self._rootItem
 
-        childItem: _TreeItem = parent_item.child(row)
-        if childItem:
-            return self.createIndex(row, column, childItem)
+        childItems = parentItem._childItems
+        if 0 <= row < len(childItems):
+            return self.createIndex(row, column, childItems[row])
         return QModelIndex()
 
     def parent(self, index=QModelIndex()) -> QModelIndex:
@@ -411,16 +520,14 @@ class TreeModel(QAbstractItemModel):
         if not index.isValid():
             return QModelIndex()
 
-        childItem: _TreeItem = self.item(index)
-        if childItem:
-            parentItem: _TreeItem = childItem.parent()
-        else:
-            parentItem = None
-
-        if parentItem == self._rootItem or not parentItem:
+        # Views call this method for nearly every index, so it only follows
+        # the parent reference and reads the cached row.
+        childItem: _TreeItem = index.internalPointer()
+        parentItem = childItem._parentItem if childItem is not None else None
+        if parentItem is None or parentItem is self._rootItem:
             return QModelIndex()
 
-        return self.createIndex(parentItem.row(), 0, parentItem)
+        return self.createIndex(parentItem._row, 0, parentItem)
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlag:
         """Override from QAbstractItemModel.
@@ -437,7 +544,7 @@ class TreeModel(QAbstractItemModel):
         if not index.isValid():
             return Qt.ItemFlag.NoItemFlags
 
-        return Qt.ItemFlag.ItemIsEditable | QAbstractItemModel.flags(self, index)
+        return _ITEM_FLAGS
 
     def insertColumns(
         self,
@@ -520,6 +627,11 @@ class TreeModel(QAbstractItemModel):
         if not parentItem:
             return False
 
+        if rows < 1 or position < 0 or position > parentItem.childCount():
+            return False
+
+        # All rows are created and spliced in at once, so attached views only
+        # handle a single insertion.
         self.beginInsertRows(parent, position, position + rows - 1)
         columnCount = self._rootItem.columnCount()
         success: bool = parentItem.insertChildren(position, rows, columnCount)
@@ -557,6 +669,65 @@ class TreeModel(QAbstractItemModel):
 
         return success
 
+    def hasChildren(self, parent=QModelIndex()) -> bool:
+        """Override from QAbstractItemModel.
+
+        Items whose children are created on demand have children as well, so
+        views show them as expandable.
+
+        Args:
+            parent (QModelIndex, optional): The parent index. Defaults to
+                QModelIndex().
+
+        Returns:
+            bool: True if the parent has or can fetch children, False
+                otherwise.
+        """
+
+        if parent.isValid() and parent.column() > 0:
+            return False
+
+        parentItem: _TreeItem = self.item(parent)
+        return bool(parentItem._childItems) or parentItem._fetchChildren is not None
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Override from QAbstractItemModel.
+
+        Args:
+            parent (QModelIndex): The parent index.
+
+        Returns:
+            bool: True if the children of the parent are not created yet.
+        """
+
+        return self.item(parent)._fetchChildren is not None
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Override from QAbstractItemModel.
+
+        Create the children of the parent using the function set with
+        _TreeItem.setFetchChildren.
+
+        Args:
+            parent (QModelIndex): The parent index.
+        """
+
+        parentItem: _TreeItem = self.item(parent)
+        fetchChildren = parentItem._fetchChildren
+        if fetchChildren is None:
+            return
+
+        parentItem._fetchChildren = None
+        children = fetchChildren(parentItem)
+        if not children:
+            return
+
+        first = parentItem.childCount()
+        self.beginInsertRows(parent, first, first + len(children) - 1)
+        for child in children:
+            parentItem.appendChild(child)
+        self.endInsertRows()
+
     def appendItem(self, item: _TreeItem) -> None:
         """Append a child item to the parent item.
 
@@ -621,10 +792,11 @@ class TreeModel(QAbstractItemModel):
             int: The number of rows in the model.
         """
 
-        if parent.isValid() and parent.column() > 0:
-            return 0
+        if not parent.isValid():
+            return len(self._rootItem._childItems)
 
-        parentItem: _TreeItem = self.item(parent)
-        if not parentItem:
+        if parent.column() > 0:
             return 0
-        return parentItem.childCount()
+
+        parentItem: _TreeItem = parent.internalPointer()
+        return len(parentItem._childItems)
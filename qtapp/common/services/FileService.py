@@ -1,37 +1,72 @@
+from functools import lru_cache
+from typing import Optional
+
 from PySide6.QtCore import QStandardPaths
 from PySide6.QtWidgets import QFileDialog
 
 from qtapp.settings.services import SettingService
 
 
+@lru_cache(maxsize=None)
+def _standardLocations(location: QStandardPaths.StandardLocation) -> tuple[str, ...]:
+    """Get the standard locations of a type.
+
+    The locations don't change while the application runs, so the operating
+    system is only queried once per type.
+
+    Args:
+        location (QStandardPaths.StandardLocation): The type of the locations.
+
+    Returns:
+        tuple[str, ...]: The locations, the preferred location first.
+    """
+
+    return tuple(QStandardPaths.standardLocations(location))
+
+
 class FileService:
     def __init__(self, settingService: SettingService):
         self._settingService = settingService
-        self._dialog = QFileDialog()
+
+        # The QFileDialog is expensive to set up and many sessions never open
+        # it, so it is created on first access.
+        self._dialog: Optional[QFileDialog] = None
+
+    @property
+    def dialog(self) -> QFileDialog:
+        if self._dialog is None:
+            self._dialog = self._createDialog()
+
+        return self._dialog
+
+    def _createDialog(self) -> QFileDialog:
+        dialog = QFileDialog()
 
         # FIXME: Loading the state doesn't work.
         # state = settingsService.value("application/fileDialogState", None, bytes)
-        # success = self._dialog.restoreState(QByteArray(state))
+        # success = dialog.restoreState(QByteArray(state))
         success = False
 
         if not success:
-            documentsLocations = QStandardPaths.standardLocations(
+            documentsLocations = _standardLocations(
                 QStandardPaths.StandardLocation.DocumentsLocation
             )
             if documentsLocations:
                 standardPath = documentsLocations[0]
             else:
-                standardPath = QStandardPaths.standardLocations(
+                standardPath = _standardLocations(
                     QStandardPaths.StandardLocation.HomeLocation
                 )[0]
 
-            self._dialog.setDirectory(standardPath)
+            dialog.setDirectory(standardPath)
 
-    @property
-    def dialog(self) -> QFileDialog:
-        return self._dialog
+        return dialog
 
     def saveState(self):
+        # A dialog that was never created has no state to save.
+        if self._dialog is None:
+            return
+
         state = self._dialog.saveState()
         self._settingService.setValue(
             "application/fileDialogState",
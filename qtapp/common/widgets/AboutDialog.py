@@ -5,7 +5,7 @@ if TYPE_CHECKING:
     from qtapp.app import BaseApplication
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QShowEvent
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -49,13 +49,10 @@ class AboutDialog(QDialog):
         licenseWidget.setAlignment(Qt.AlignmentFlag.AlignCenter)
         licenseWidget.setLayout(licenseLayout)
 
-        try:
-            with open(licenseFile, "r", encoding="utf-8") as f:
-                license.setText(f.read())
-        except Exception as err:
-            QMessageBox.critical(
-                self, "LICENSE", f"Error while reading LICENSE file: {str(err)}"
-            )
+        # The license is read when the dialog is shown for the first time, so
+        # creating the dialog doesn't wait for the file.
+        self._license = license
+        self._licenseFile: Optional[Path] = licenseFile
 
         # Add the close button
         actionBtns = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
@@ -71,3 +68,23 @@ class AboutDialog(QDialog):
 
         self.setWindowTitle(f"About {app.applicationName}")
         self.setFixedSize(700, 400)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Override from QDialog."""
+
+        super().showEvent(event)
+
+        if self._licenseFile is None:
+            return
+
+        licenseFile, self._licenseFile = self._licenseFile, None
+        # Replace invalid characters instead of failing on files with mixed
+        # encodings. The license is plain text, so Qt doesn't have to check
+        # whether it is rich text.
+        try:
+            text = licenseFile.read_text(encoding="utf-8", errors="replace")
+            self._license.setPlainText(text)
+        except OSError as err:
+            QMessageBox.critical(
+                self, "LICENSE", f"Error while reading LICENSE file: {str(err)}"
+            )
@@ -1,4 +1,6 @@
-from PySide6.QtCore import QRect, Signal
+from typing import Optional
+
+from PySide6.QtCore import QEvent, QRect, Signal
 from PySide6.QtGui import QMouseEvent
 from PySide6.QtWidgets import QLabel
 
@@ -15,8 +17,27 @@ class ClickableLabel(QLabel):
 
     def __init__(self, text: str = "", **kwargs) -> None:
         super().__init__(**kwargs)
+
+        # The rectangle around the text, calculated on first use and reset
+        # whenever the text or the font changes.
+        self._textRect: Optional[QRect] = None
+
         self.setText(text)
 
+    def setText(self, text: str) -> None:
+        """Override from QLabel."""
+
+        self._textRect = None
+        super().setText(text)
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Override from QLabel."""
+
+        if event.type() == QEvent.Type.FontChange:
+            self._textRect = None
+
+        super().changeEvent(event)
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """Override from QLabel."""
 
@@ -32,6 +53,9 @@ class ClickableLabel(QLabel):
             QRect: The rectangle enclosing the text.
         """
 
+        if self._textRect is not None:
+            return self._textRect
+
         # First calculate the font metrics based on the text.
         # Afterwards create a new QRect, x and y set to zero. This is a
         # workaround and might not work for all texts.
@@ -39,4 +63,5 @@ class ClickableLabel(QLabel):
         # correct x and y coordinates (they are negative and don't start at the
         # right position).
         rect = self.fontMetrics().boundingRect(self.text())
-        return QRect(0, 0, rect.width(), rect.height())
+        self._textRect = QRect(0, 0, rect.width(), rect.height())
+        return self._textRect
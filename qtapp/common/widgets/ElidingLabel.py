@@ -1,7 +1,7 @@
 from typing import Optional
 
-from PySide6.QtCore import QPoint, Qt, Signal
-from PySide6.QtGui import QPainter, QPaintEvent, QTextLayout
+from PySide6.QtCore import QEvent, QPoint, Qt, Signal
+from PySide6.QtGui import QPainter, QPaintEvent, QStaticText, QTransform
 from PySide6.QtWidgets import QLabel
 
 
@@ -57,6 +57,17 @@ class ElidingLabel(QLabel):
         self._mode = mode
         self._isElided = False
 
+        # The text, size, mode and alignment the elided line and its position
+        # were calculated for. Both are reused as long as they and the font
+        # don't change.
+        self._elisionKey: Optional[tuple] = None
+        self._textPosition = QPoint()
+
+        # The elided line with its glyphs laid out, so repaints don't shape
+        # the text again.
+        self._staticText = QStaticText()
+        self._staticText.setTextFormat(Qt.TextFormat.PlainText)
+
         self.setText(text)
 
     def setText(self, text: str):
@@ -73,6 +84,7 @@ class ElidingLabel(QLabel):
         # initialized for testing. The value should always be the same as
         # contents when not elided.
         self._elidedLine = text
+        self._elisionKey = None
 
         self.update()
 
@@ -94,47 +106,52 @@ class ElidingLabel(QLabel):
 
         super().paintEvent(event)
 
-        didElide = False
-
         painter = QPainter(self)
-        fontMetrics = painter.fontMetrics()
-        textWidth = fontMetrics.horizontalAdvance(self.text())
-
-        # Layout
-        textLayout = QTextLayout(self._contents, painter.font())
-        textLayout.beginLayout()
-
-        while True:
-            line = textLayout.createLine()
-
-            if not line.isValid():
-                break
-
-            line.setLineWidth(self.width())
-            point = self._calculateTextAlignment()
-
-            if textWidth >= self.width():
+        width = self.width()
+
+        # The label shows a single line, so the text is drawn directly. A
+        # text layout is not needed, neither for the full nor the elided text.
+        # Repaints without changes, e.g. while other widgets are resized,
+        # don't have to measure the text at all.
+        elisionKey = (
+            self._contents,
+            width,
+            self.height(),
+            self._mode,
+            self.alignment(),
+        )
+        if elisionKey != self._elisionKey:
+            fontMetrics = painter.fontMetrics()
+            textWidth = fontMetrics.horizontalAdvance(self._contents)
+            if textWidth >= width:
                 self._elidedLine = fontMetrics.elidedText(
-                    self._contents, self._mode, self.width()
+                    self._contents, self._mode, width
                 )
-                painter.drawText(
-                    QPoint(
-                        point.x(),
-                        point.y() + fontMetrics.ascent(),
-                    ),
-                    self._elidedLine,
-                )
-                didElide = line.isValid()
-                break
             else:
-                line.draw(painter, point)
+                self._elidedLine = self._contents
+
+            self._staticText.setText(self._elidedLine)
+            self._staticText.prepare(QTransform(), painter.font())
+            self._textPosition = self._calculateTextAlignment()
+            self._elisionKey = elisionKey
 
-        textLayout.endLayout()
+        # Static text is positioned by its top left corner, not the baseline.
+        painter.drawStaticText(self._textPosition, self._staticText)
+
+        didElide = self._elidedLine != self._contents
 
         if didElide != self._isElided:
             self._isElided = didElide
             self.elisionChanged.emit(didElide)
 
+    def changeEvent(self, event: QEvent) -> None:
+        """Override from QLabel."""
+
+        if event.type() == QEvent.Type.FontChange:
+            self._elisionKey = None
+
+        super().changeEvent(event)
+
     def _calculateTextAlignment(self) -> QPoint:
         """Calculate the alignment position for the text based on the label's
         alignment flags.
@@ -144,25 +161,25 @@ class ElidingLabel(QLabel):
         """
 
         alignment = self.alignment()
+        fontMetrics = self.fontMetrics()
         textPosition = QPoint()
 
         if alignment & Qt.AlignmentFlag.AlignLeft:
             textPosition.setX(0)
-        elif alignment & Qt.AlignmentFlag.AlignRight:
-            textPosition.setX(
-                self.width() - self.fontMetrics().boundingRect(self.text()).width()
-            )
-        elif alignment & Qt.AlignmentFlag.AlignHCenter:
-            textPosition.setX(
-                (self.width() - self.fontMetrics().boundingRect(self.text()).width())
-                // 2
-            )
+        elif alignment & (Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignHCenter):
+            space = self.width() - fontMetrics.boundingRect(self._contents).width()
+            if alignment & Qt.AlignmentFlag.AlignRight:
+                textPosition.setX(space)
+            else:
+                textPosition.setX(space // 2)
 
         if alignment & Qt.AlignmentFlag.AlignTop:
             textPosition.setY(0)
-        elif alignment & Qt.AlignmentFlag.AlignBottom:
-            textPosition.setY(self.height() - self.fontMetrics().height())
-        elif alignment & Qt.AlignmentFlag.AlignVCenter:
-            textPosition.setY((self.height() - self.fontMetrics().height()) // 2)
+        elif alignment & (Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignVCenter):
+            space = self.height() - fontMetrics.height()
+            if alignment & Qt.AlignmentFlag.AlignBottom:
+                textPosition.setY(space)
+            else:
+                textPosition.setY(space // 2)
 
         return textPosition
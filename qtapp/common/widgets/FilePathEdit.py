@@ -1,11 +1,13 @@
+import os
 from pathlib import Path
 from typing import Optional
 
-import qtawesome as qta
-from PySide6.QtCore import QFileInfo, Qt, QUrl, Slot
+from PySide6.QtCore import Qt, QUrl, Slot
 from PySide6.QtGui import QDragEnterEvent, QDropEvent, QMouseEvent
 from PySide6.QtWidgets import QFileDialog, QLineEdit, QWidget
 
+from qtapp.utils import icons
+
 
 class FilePathEdit(QLineEdit):
     """A custom QLineEdit for editing file paths.
@@ -28,39 +30,72 @@ class FilePathEdit(QLineEdit):
         self._dialog = dialog
         self._filter = filter
 
+        # The text passed to setText last, along with the path shown for it.
+        self._rawText: Optional[str] = None
+        self._pathText = ""
+
         self.setReadOnly(True)
         self.setPlaceholderText("Drag and drop a file here or double click")
 
-        icon = qta.icon("ph.folder-open-light")
+        icon = icons.icon("ph.folder-open-light")
         self._action = self.addAction(icon, QLineEdit.ActionPosition.TrailingPosition)
         self._action.triggered.connect(self._onOpenFileBtnClicked)
 
     def setText(self, text: str) -> None:
         """Override from QLineEdit."""
 
+        # Setting the same text again doesn't have to convert it again, unless
+        # the shown text was changed in another way, e.g. by clear().
+        if text == self._rawText and self.text() == self._pathText:
+            return
+
         # Convert text first to path to get the right slashes (forward or backslash).
         # If text is None or empty, set an empty string.
-        text = Path(text) if text else ""
-        super().setText(str(text))
+        self._rawText = text
+        self._pathText = str(Path(text)) if text else ""
+        super().setText(self._pathText)
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         """Override from QLineEdit."""
 
-        mimeData = event.mimeData()
-
-        # Check if the dragged data contains file paths.
-        if mimeData.hasUrls() and all(url.isLocalFile() for url in mimeData.urls()):
+        # Accept the dragged data only if it contains file paths.
+        if self._localUrls(event):
             event.acceptProposedAction()
 
     def dropEvent(self, event: QDropEvent) -> None:
         """Override from QLineEdit."""
 
+        # Handle the dropped file paths. Making the path absolute is a pure
+        # string operation, so the file isn't queried.
+        urls = self._localUrls(event)
+        if urls:
+            self.setText(os.path.abspath(urls[0].toLocalFile()))
+
+    def _localUrls(self, event: QDropEvent) -> list[QUrl]:
+        """Get the URLs of the data of a drag or drop event if all of them are
+        local files.
+
+        The check runs on every drag move over the edit, so it returns as soon
+        as a URL turns out not to be a local file.
+
+        Args:
+            event (QDropEvent): The drag or drop event.
+
+        Returns:
+            list[QUrl]: The URLs, or an empty list if there are no URLs or not
+                all of them are local files.
+        """
+
         mimeData = event.mimeData()
+        if not mimeData.hasUrls():
+            return []
+
+        urls = mimeData.urls()
+        for url in urls:
+            if not url.isLocalFile():
+                return []
 
-        # Handle the dropped file paths.
-        if mimeData.hasUrls() and all(url.isLocalFile() for url in mimeData.urls()):
-            fileInfo = QFileInfo(mimeData.urls()[0].toLocalFile())
-            self.setText(fileInfo.absoluteFilePath())
+        return urls
 
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         """Override from QLineEdit."""
@@ -1,7 +1,6 @@
 from enum import Enum
 from typing import Optional
 
-import qtawesome as qta
 from PySide6.QtCore import QSize, Qt
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
@@ -14,6 +13,9 @@ from PySide6.QtWidgets import (
 )
 
 from qtapp.common.widgets import ElidingLabel
+from qtapp.utils import icons
+
+_ICON_SIZE = QSize(22, 22)
 
 
 class InlineNotification(QFrame):
@@ -73,32 +75,27 @@ class InlineNotification(QFrame):
         self.setup_ui()
 
     def setup_ui(self):
-        self.setStyleSheet(
-            "InlineNotification {"
-            f"background-color: {self._type.value[1]};"
-            f"border-top: 1px solid {self._type.value[2]};"
-            f"border-bottom: 1px solid {self._type.value[2]};"
-            "}"
-        )
+        # The style sheet of each type is built once from its colors. It is
+        # set on the notification itself, so it applies whatever style sheet
+        # the application sets.
+        self.setStyleSheet(_STYLE_SHEETS[self._type])
 
         self._icon = QPushButton()
-        self._icon.setIcon(qta.icon(self._type.value[0]))
-        self._icon.setIconSize(QSize(22, 22))
-        self._icon.setStyleSheet(
-            "QPushButton { background-color: transparent; padding: 0px; }"
-        )
+        self._icon.setObjectName("inlineNotificationIcon")
+        self._icon.setIcon(icons.pixmapIcon(self._type.value[0], _ICON_SIZE))
+        self._icon.setIconSize(_ICON_SIZE)
 
         self._label = ElidingLabel(parent=self)
         self._label.setText(self._text)
 
         self._closeBtn = QPushButton()
-        self._closeBtn.setStyleSheet("QPushButton { background-color: transparent; }")
-        self._closeBtn.setIcon(qta.icon("ph.x-light"))
+        self._closeBtn.setObjectName("inlineNotificationCloseButton")
+        self._closeBtn.setIcon(icons.icon("ph.x-light"))
         self._closeBtn.clicked.connect(self.close_)
 
         self._actionBtnLayout = QHBoxLayout()
 
-        self._layout = QHBoxLayout()
+        self._layout = QHBoxLayout(self)
         self._layout.setContentsMargins(2, 2, 2, 2)
         self._layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
         self._layout.addWidget(self._icon)
@@ -106,8 +103,6 @@ class InlineNotification(QFrame):
         self._layout.addLayout(self._actionBtnLayout)
         self._layout.addWidget(self._closeBtn)
 
-        self.setLayout(self._layout)
-
     def setText(self, text: str) -> None:
         """Set the text for the notification banner.
 
@@ -176,6 +171,40 @@ class InlineNotification(QFrame):
         self.setVisible(False)
 
 
+def _buildStyleSheet(type: InlineNotification.NotificationType) -> str:
+    """Build the style sheet of a notification type from its colors.
+
+    Args:
+        type (NotificationType): The notification type.
+
+    Returns:
+        str: The style sheet of notifications of the type.
+    """
+
+    _, background, border = type.value
+    return f"""
+        InlineNotification {{
+            background-color: {background};
+            border-top: 1px solid {border};
+            border-bottom: 1px solid {border};
+        }}
+
+        QPushButton#inlineNotificationIcon {{
+            background-color: transparent;
+            padding: 0px;
+        }}
+
+        QPushButton#inlineNotificationCloseButton {{
+            background-color: transparent;
+        }}
+    """
+
+
+_STYLE_SHEETS = {
+    type: _buildStyleSheet(type) for type in InlineNotification.NotificationType
+}
+
+
 class InlineNotificationList(QWidget):
     """A container for managing InlineNotifications.
 
@@ -198,12 +227,10 @@ class InlineNotificationList(QWidget):
         self.setGraphicsEffect(shadow)
 
     def setupUi(self) -> None:
-        self._layout = QVBoxLayout()
+        self._layout = QVBoxLayout(self)
         self._layout.setSpacing(0)
         self._layout.setContentsMargins(0, 0, 0, 0)
 
-        self.setLayout(self._layout)
-
     def addNotification(self, notification: InlineNotification) -> None:
         """Add a notification to the container.
 
@@ -219,6 +246,11 @@ class InlineNotificationList(QWidget):
             self._layout.removeWidget(notification)
             notification.setParent(self)
 
+        # The container already draws a shadow around all notifications.
+        # Another shadow per notification would render each notification
+        # offscreen once more on every repaint.
+        _setShadowEnabled(notification, False)
+
         self._layout.addWidget(notification)
 
         notification.open()
@@ -233,3 +265,17 @@ class InlineNotificationList(QWidget):
 
         notification.close_()
         notification.setParent(None)
+        _setShadowEnabled(notification, True)
+
+
+def _setShadowEnabled(widget: QWidget, enabled: bool) -> None:
+    """Enable or disable the drop shadow effect of a widget.
+
+    Args:
+        widget (QWidget): The widget.
+        enabled (bool): True to enable the shadow, False to disable it.
+    """
+
+    effect = widget.graphicsEffect()
+    if effect is not None:
+        effect.setEnabled(enabled)
@@ -1,10 +1,13 @@
-from typing import Optional
+from typing import Iterable, Optional
 
-import qtawesome as qta
 from PySide6.QtCore import QSize
 from PySide6.QtGui import Qt
 from PySide6.QtWidgets import QButtonGroup, QToolBar, QToolButton, QWidget
 
+from qtapp.utils import icons
+
+_ICON_SIZE = QSize(28, 28)
+
 
 class NavigationBarButton(QToolButton):
     """A custom QToolButton for use in the applications NavigationBar."""
@@ -18,8 +21,9 @@ class NavigationBarButton(QToolButton):
     ) -> None:
         super().__init__(parent)
 
-        icon = qta.icon(
+        icon = icons.pixmapIcon(
             qtaIconStr,
+            _ICON_SIZE,
             color=kwargs.get("color", "#484644"),
             color_on=kwargs.get("color_on", "#106EBE"),
             color_active=kwargs.get("color_active", "#484644"),
@@ -41,7 +45,7 @@ class NavigationBar(QToolBar):
     def setupUi(self) -> None:
         self.setMovable(False)
         self.setOrientation(Qt.Orientation.Vertical)
-        self.setIconSize(QSize(28, 28))
+        self.setIconSize(_ICON_SIZE)
         self.setContentsMargins(0, 0, 0, 0)
         self.layout().setContentsMargins(0, 0, 0, 0)
         self.layout().setSpacing(0)
@@ -53,5 +57,21 @@ class NavigationBar(QToolBar):
             navBarBtn (NavigationBarButton): The button to add.
         """
 
-        self.addWidget(navBarBtn)
-        self._btnGroup.addButton(navBarBtn)
+        self.addButtons([navBarBtn])
+
+    def addButtons(self, navBarBtns: Iterable[NavigationBarButton]) -> None:
+        """Add multiple buttons to the NavigationBar at once.
+
+        The NavigationBar isn't updated until all buttons are added.
+
+        Args:
+            navBarBtns (Iterable[NavigationBarButton]): The buttons to add.
+        """
+
+        self.setUpdatesEnabled(False)
+        try:
+            for navBarBtn in navBarBtns:
+                self.addWidget(navBarBtn)
+                self._btnGroup.addButton(navBarBtn)
+        finally:
+            self.setUpdatesEnabled(True)
@@ -1,9 +1,13 @@
 from typing import Optional
 
-from PySide6.QtCore import QUrl
+from PySide6.QtCore import QTimer, QUrl, Slot
 from PySide6.QtGui import QDesktopServices, QTextCursor
 from PySide6.QtWidgets import QTextBrowser, QWidget
 
+# The time in milliseconds printed texts are collected before they are added
+# to the document at once.
+_FLUSH_DELAY = 30
+
 
 class OutputWidget(QTextBrowser):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
@@ -14,12 +18,38 @@ class OutputWidget(QTextBrowser):
         self.setLineWrapMode(QTextBrowser.LineWrapMode.NoWrap)
         self.anchorClicked.connect(self.openUrl)
 
+        # Chatty producers print many texts in a row. Collect them and add
+        # them to the document at once, so the view only scrolls and
+        # repaints once for all of them.
+        self._pending: list[str] = []
+        self._flushTimer = QTimer(self)
+        self._flushTimer.setSingleShot(True)
+        self._flushTimer.setInterval(_FLUSH_DELAY)
+        self._flushTimer.timeout.connect(self.flush)
+
     def openUrl(self, url: str | QUrl) -> None:
         QDesktopServices.openUrl(url)
 
     def print(self, text: str) -> None:
+        self._pending.append(text)
+        if not self._flushTimer.isActive():
+            self._flushTimer.start()
+
+    @Slot()
+    def flush(self) -> None:
+        """Add all printed texts, which are not shown yet, to the document."""
+
+        self._flushTimer.stop()
+        if not self._pending:
+            return
+
         cursor = self.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertHtml(text)
-        cursor.insertText("\n")
+        cursor.beginEditBlock()
+        for text in self._pending:
+            cursor.insertHtml(text)
+            cursor.insertText("\n")
+        cursor.endEditBlock()
+        self._pending.clear()
+
         self.setTextCursor(cursor)
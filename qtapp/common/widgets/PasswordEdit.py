@@ -1,10 +1,10 @@
 from typing import Optional
 
-import qtawesome as qta
 from PySide6.QtCore import Slot
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QLineEdit, QWidget
 
+from qtapp.utils import icons
+
 
 class PasswordEdit(QLineEdit):
     """A custom QLineEdit for showing and editing passwords.
@@ -19,20 +19,29 @@ class PasswordEdit(QLineEdit):
         self.setEchoMode(QLineEdit.EchoMode.Password)
         self.setPlaceholderText("Password...")
 
+        # The icons are swapped on every toggle, so fetch them only once.
+        self._showIcon = icons.icon("ph.eye-light")
+        self._hideIcon = icons.icon("ph.eye-slash-light")
+
+        # The edit starts with the password hidden, so the action starts with
+        # the icon to show it.
         self._action = self.addAction(
-            QIcon(),
+            self._showIcon,
             QLineEdit.ActionPosition.TrailingPosition,
         )
         self._action.setCheckable(True)
         self._action.toggled.connect(self.showPassword)
 
-        self.showPassword(False)
-
     @Slot()
     def showPassword(self, show: bool) -> None:
+        # Changing the echo mode updates the whole edit, so skip it if the
+        # password is already shown or hidden.
+        if (self.echoMode() == QLineEdit.EchoMode.Normal) == show:
+            return
+
         if show:
             self.setEchoMode(QLineEdit.EchoMode.Normal)
-            self._action.setIcon(qta.icon("ph.eye-slash-light"))
+            self._action.setIcon(self._hideIcon)
         else:
             self.setEchoMode(QLineEdit.EchoMode.Password)
-            self._action.setIcon(qta.icon("ph.eye-light"))
+            self._action.setIcon(self._showIcon)
@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import QSignalBlocker, Qt, Signal, Slot
 from PySide6.QtGui import QDragEnterEvent, QDragMoveEvent, QDropEvent
 from PySide6.QtWidgets import (
     QFileDialog,
@@ -63,15 +63,22 @@ class PathList(QWidget):
     displaying file paths.
 
     Signals:
-        dataChanged: Emitted when the underlying model data is changed.
+        dataChanged: Emitted when the underlying model data is changed. Use
+            the paths method to get the changed list of paths.
 
     Args:
         model (PathListModel): The model for managing file paths. If no model
             is provided a new model will be created.
         parent (QWidget): The parent widget (default = None).
+        dialog (Optional[QFileDialog]): The file dialog whose directory is
+            used as the starting directory when adding paths. If no dialog is
+            provided, the file dialogs open in the current working directory
+            (default = None).
+        filter (Optional[str]): The filter of the file dialog or "dir" to
+            select directories (default = "dir").
     """
 
-    dataChanged = Signal(list)
+    dataChanged = Signal()
 
     def __init__(
         self,
@@ -88,13 +95,22 @@ class PathList(QWidget):
         self.dataChanged.connect(self._onDataChanged)
 
         # Every time the model data changes, emit the dataChanged Signal of
-        # the widget.
-        self.model.dataChanged.connect(lambda: self.dataChanged.emit(self.model.items))
+        # the widget. Inserted, removed and moved rows don't emit the
+        # dataChanged Signal of the model, so they must be connected
+        # separately. Each drop on the model emits only one of them. The
+        # Signals are connected directly, so no Python code runs in between.
+        self.model.dataChanged.connect(self.dataChanged)
+        self.model.rowsInserted.connect(self.dataChanged)
+        self.model.rowsRemoved.connect(self.dataChanged)
+        self.model.rowsMoved.connect(self.dataChanged)
+        self.model.layoutChanged.connect(self.dataChanged)
+        self.model.modelReset.connect(self.dataChanged)
 
         self.setupUi()
 
-        # Set initial state.
-        self.setPaths([])
+        # Set initial state. The model is kept as it is, a new model is empty
+        # already.
+        self._onSelectionChanged()
 
     @property
     def model(self) -> PathListModel:
@@ -127,13 +143,11 @@ class PathList(QWidget):
         buttonLayout.addWidget(self._addBtn)
         buttonLayout.addWidget(self._deleteBtn)
 
-        layout = QHBoxLayout()
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self._pathListView)
         layout.addLayout(buttonLayout)
 
-        self.setLayout(layout)
-        self.layout().setContentsMargins(0, 0, 0, 0)
-
     @Slot()
     def _onDataChanged(self) -> None:
         """Slot triggered when the dataChanged Signal is emitted."""
@@ -160,14 +174,17 @@ class PathList(QWidget):
     def addPath(self) -> None:
         """Open a file dialog to add a new Path."""
 
+        # The static functions of QFileDialog open the dialog only while it is
+        # needed, so no dialog has to be kept for each PathList.
+        directory = self._dialog.directory().path() if self._dialog else ""
         if self._filter == "dir":
-            paths = [self._dialog.getExistingDirectory()]
+            paths = [QFileDialog.getExistingDirectory(self, dir=directory)]
         else:
-            paths, _ = self._dialog.getOpenFileNames(filter=self._filter)
+            paths, _ = QFileDialog.getOpenFileNames(
+                self, dir=directory, filter=self._filter
+            )
 
-        for path in paths:
-            if path:
-                self.model.appendItem(Path(path))
+        self.model.appendItems([Path(path) for path in paths if path])
 
     @Slot()
     def removePaths(self) -> None:
@@ -175,8 +192,14 @@ class PathList(QWidget):
 
         indexes = self._pathListView.selectionModel().selectedRows()
         items = [self.model.item(index) for index in indexes]
-        for item in items:
-            self.model.removeItem(item)
+
+        # The model notifies about each run of contiguous rows separately.
+        # Emit the dataChanged Signal only once for all of them.
+        with QSignalBlocker(self):
+            removed = self.model.removeItems(items)
+
+        if removed:
+            self.dataChanged.emit()
 
     def paths(self) -> list[Path]:
         """Get the list of Paths.
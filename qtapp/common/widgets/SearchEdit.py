@@ -1,16 +1,22 @@
 from typing import Optional
 
-import qtawesome as qta
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
 from PySide6.QtWidgets import QLineEdit
 
+from qtapp.utils import icons
+
+# The time in milliseconds to wait for further keystrokes before the search
+# string is emitted.
+_SEARCH_DELAY = 150
+
 
 class SearchEdit(QLineEdit):
     """A custom QLineEdit for searching.
 
     Signals:
         searchChanged: Emitted when the search string is changed. The Signal
-            provides the search string.
+            provides the search string. While the user is typing, the Signal
+            is emitted once the typing pauses.
 
     Args:
         parent (QObject): The parent widget (default = None).
@@ -21,15 +27,31 @@ class SearchEdit(QLineEdit):
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
 
-        self.textChanged.connect(self.searchChanged.emit)
+        # Searching on every keystroke is wasteful, so changes are collected
+        # until the typing pauses.
+        self._searchTimer = QTimer(self)
+        self._searchTimer.setSingleShot(True)
+        self._searchTimer.setInterval(_SEARCH_DELAY)
+        self._searchTimer.timeout.connect(self._onSearchTimeout)
+        self.textChanged.connect(lambda: self._searchTimer.start())
+
         self.setPlaceholderText("Search...")
 
         self._clear_btn = self.addAction(
-            qta.icon("ph.x-light"),
+            icons.icon("ph.x-light"),
             QLineEdit.ActionPosition.TrailingPosition,
         )
         self._clear_btn.triggered.connect(self._onClearBtnClicked)
 
+    @Slot()
+    def _onSearchTimeout(self) -> None:
+        """Slot triggered when the typing paused.
+
+        Emits the searchChanged Signal with the current search string.
+        """
+
+        self.searchChanged.emit(self.text())
+
     @Slot()
     def _onClearBtnClicked(self):
         """Slot triggered when the clear button is pressed.
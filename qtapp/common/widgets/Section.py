@@ -1,8 +1,9 @@
+from functools import lru_cache
 from typing import Optional
 
-import qtawesome as qta
 from PySide6.QtCore import (
     QAbstractAnimation,
+    QMetaObject,
     QParallelAnimationGroup,
     QPropertyAnimation,
     Qt,
@@ -20,6 +21,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from qtapp.utils import icons
+
 
 class _ToolButtonProxyStyle(QProxyStyle):
     """A custom proxy style for tool buttons.
@@ -58,6 +61,21 @@ class _ToolButtonProxyStyle(QProxyStyle):
         return ret
 
 
+@lru_cache(maxsize=None)
+def _toolButtonProxyStyle() -> _ToolButtonProxyStyle:
+    """Get the _ToolButtonProxyStyle shared by the toggle buttons of all
+    Sections.
+
+    The style holds no state, so one instance is enough. It is created on
+    first use, as it is based on the style of the running application.
+
+    Returns:
+        _ToolButtonProxyStyle: The shared style.
+    """
+
+    return _ToolButtonProxyStyle()
+
+
 class Section(QWidget):
     """A collapsible section widget with a toggle button.
 
@@ -92,11 +110,17 @@ class Section(QWidget):
         super().__init__(parent)
         self._animDuration = animationDuration
 
+        # The icons of the toggle button for both states and the state shown
+        # last, which matches the unchecked toggle button.
+        self._toggledIcon = icons.icon("ph.caret-down", color="grey")
+        self._untoggledIcon = icons.icon("ph.caret-right", color="grey")
+        self._toggled = False
+
         self._toggleBtn = QToolButton()
         self._toggleBtn.setStyleSheet("QToolButton { border: none; }")
         self._toggleBtn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-        self._toggleBtn.setStyle(_ToolButtonProxyStyle())
-        self._toggleBtn.setIcon(qta.icon("ph.caret-right", color="grey"))
+        self._toggleBtn.setStyle(_toolButtonProxyStyle())
+        self._toggleBtn.setIcon(self._untoggledIcon)
         self._toggleBtn.setText(str(title))
         self._toggleBtn.setCheckable(True)
         self._toggleBtn.setChecked(False)
@@ -126,7 +150,7 @@ class Section(QWidget):
             QPropertyAnimation(self._contentArea, b"maximumHeight")
         )
 
-        self._mainLayout = QGridLayout()
+        self._mainLayout = QGridLayout(self)
         self._mainLayout.setVerticalSpacing(0)
         self._mainLayout.setContentsMargins(0, 0, 0, 0)
         self._mainLayout.addWidget(
@@ -139,7 +163,6 @@ class Section(QWidget):
         )
         self._mainLayout.addWidget(self._headerLine, 0, 2, 1, 1)
         self._mainLayout.addWidget(self._contentArea, 1, 0, 1, 3)
-        self.setLayout(self._mainLayout)
 
         self._toggleBtn.toggled.connect(self.toggle)
 
@@ -186,14 +209,28 @@ class Section(QWidget):
                 False if it should be expanded.
         """
 
-        arrowType = "ph.caret-down" if collapsed else "ph.caret-right"
+        # Toggling to the state shown already would restart the animation
+        # from its end.
+        if collapsed == self._toggled:
+            return
+
+        self._toggled = collapsed
+        icon = self._toggledIcon if collapsed else self._untoggledIcon
         direction = (
             QAbstractAnimation.Direction.Forward
             if collapsed
             else QAbstractAnimation.Direction.Backward
         )
 
-        self._toggleBtn.setIcon(qta.icon(arrowType, color="grey"))
+        self._toggleBtn.setIcon(icon)
         self._toggleAnim.setDirection(direction)
 
-        self._toggleAnim.start()
+        # Start the animation from the event loop, so that toggling many
+        # Sections at once, e.g. in a loop, starts all their animations in the
+        # same iteration and on the same timer tick. Starting an animation
+        # that is already running does nothing.
+        QMetaObject.invokeMethod(
+            self._toggleAnim,
+            "start",
+            Qt.ConnectionType.QueuedConnection,
+        )
@@ -6,7 +6,71 @@ from PySide6.QtWidgets import QMainWindow, QWidget
 T = TypeVar("T")
 
 
-class StatefulWidget(QWidget, Generic[T]):
+class _StatefulMixin(Generic[T]):
+    """Implementation of the state shared by StatefulWidget and
+    StatefulMainWindow.
+
+    The classes using it must declare the stateChanged Signal themselves and
+    call _initState in their constructor.
+    """
+
+    def _initState(self, initState: T) -> None:
+        """Set the initial state and connect the onStateChanged slot.
+
+        Args:
+            initState (T): The initial state of the widget.
+        """
+
+        self._state = initState
+
+        # The default onStateChanged slot does nothing, so it is only
+        # connected if a subclass overrides it.
+        if type(self).onStateChanged is not _StatefulMixin.onStateChanged:
+            self.stateChanged.connect(self.onStateChanged)
+
+    @property
+    def state(self) -> T:
+        """Get the current state of the widget.
+
+        Returns:
+            T: The current state.
+        """
+
+        return self._state
+
+    @state.setter
+    def state(self, state: T) -> None:
+        """Set the state of the widget and emits the state_changed signal if
+        the state has changed.
+
+        Args:
+            state (T): The new state.
+        """
+
+        # Setting the same object again is the common case and doesn't need
+        # a possibly deep comparison of the states.
+        previousState = self._state
+        if previousState is state or previousState == state:
+            return
+
+        self._state = state
+        self.stateChanged.emit(state, previousState)
+
+    @Slot()
+    def onStateChanged(self, current: T, previous: T) -> None:
+        """Slot called when the state_changed signal is emitted.
+
+        Can be overwritten by subclasses.
+
+        Args:
+            current (T): The current state.
+            previous (T): The previous state.
+        """
+
+        return None
+
+
+class StatefulWidget(QWidget, _StatefulMixin[T]):
     """A generic stateful widget that emits a signal when the state changes.
 
     Args:
@@ -63,49 +127,10 @@ class StatefulWidget(QWidget, Generic[T]):
         """
 
         super().__init__(parent, flags)
+        self._initState(initState)
 
-        self._state = initState
-        self.stateChanged.connect(self.onStateChanged)
-
-    @property
-    def state(self) -> T:
-        """Get the current state of the widget.
 
-        Returns:
-            T: The current state.
-        """
-
-        return self._state
-
-    @state.setter
-    def state(self, state: T) -> None:
-        """Set the state of the widget and emits the state_changed signal if
-        the state has changed.
-
-        Args:
-            state (T): The new state.
-        """
-
-        previousState = self._state
-        if previousState != state:
-            self._state = state
-            self.stateChanged.emit(state, previousState)
-
-    @Slot()
-    def onStateChanged(self, current: T, previous: T) -> None:
-        """Slot called when the state_changed signal is emitted.
-
-        Can be overwritten by subclasses.
-
-        Args:
-            current (T): The current state.
-            previous (T): The previous state.
-        """
-
-        return None
-
-
-class StatefulMainWindow(QMainWindow, Generic[T]):
+class StatefulMainWindow(QMainWindow, _StatefulMixin[T]):
     """A generic stateful widget that emits a signal when the state changes.
 
     Args:
@@ -162,43 +187,4 @@ class StatefulMainWindow(QMainWindow, Generic[T]):
         """
 
         super().__init__(parent, flags)
-
-        self._state = initState
-        self.stateChanged.connect(self.onStateChanged)
-
-    @property
-    def state(self) -> T:
-        """Get the current state of the widget.
-
-        Returns:
-            T: The current state.
-        """
-
-        return self._state
-
-    @state.setter
-    def state(self, state: T) -> None:
-        """Set the state of the widget and emits the state_changed signal if
-        the state has changed.
-
-        Args:
-            state (T): The new state.
-        """
-
-        previousState = self._state
-        if previousState != state:
-            self._state = state
-            self.stateChanged.emit(state, previousState)
-
-    @Slot()
-    def onStateChanged(self, current: T, previous: T) -> None:
-        """Slot called when the state_changed signal is emitted.
-
-        Can be overwritten by subclasses.
-
-        Args:
-            current (T): The current state.
-            previous (T): The previous state.
-        """
-
-        return None
+        self._initState(initState)
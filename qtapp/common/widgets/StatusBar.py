@@ -1,10 +1,12 @@
 from typing import Optional
 
-import qtawesome as qta
 from PySide6.QtCore import QSize, Qt
 from PySide6.QtWidgets import QToolBar, QToolButton, QWidget
 
 from qtapp.common.widgets.ToolBarSpacer import ToolBarSpacer
+from qtapp.utils import icons
+
+_ICON_SIZE = QSize(18, 18)
 
 
 class StatusBarButton(QToolButton):
@@ -28,7 +30,7 @@ class StatusBarButton(QToolButton):
         self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
 
         if qtaIcon:
-            self.setIcon(qta.icon(qtaIcon, color="#484644"))
+            self.setIcon(icons.pixmapIcon(qtaIcon, _ICON_SIZE, color="#484644"))
 
         if text:
             self.setText(text)
@@ -42,7 +44,7 @@ class StatusBar(QToolBar):
 
     def setupUi(self) -> None:
         self.setMovable(False)
-        self.setIconSize(QSize(18, 18))
+        self.setIconSize(_ICON_SIZE)
         self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.setContentsMargins(4, 0, 4, 0)
         self.layout().setContentsMargins(0, 0, 0, 0)
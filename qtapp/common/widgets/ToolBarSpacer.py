@@ -2,13 +2,17 @@ from typing import Optional
 
 from PySide6.QtWidgets import QSizePolicy, QWidget
 
+# QSizePolicy is a value type, which widgets copy when it is set. So all
+# spacers can share the same policy.
+_SIZE_POLICY = QSizePolicy(
+    QSizePolicy.Policy.Expanding,
+    QSizePolicy.Policy.Preferred,
+)
+
 
 class ToolBarSpacer(QWidget):
     """A widget that acts as a spacer in a QToolBar."""
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
-        self.setSizePolicy(
-            QSizePolicy.Policy.Expanding,
-            QSizePolicy.Policy.Preferred,
-        )
+        self.setSizePolicy(_SIZE_POLICY)
@@ -1,7 +1,14 @@
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QMouseEvent, QPainter, QPaintEvent
+from PySide6.QtCore import QEvent, QPointF, Qt, Signal
+from PySide6.QtGui import (
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QStaticText,
+    QTextOption,
+    QTransform,
+)
 from PySide6.QtWidgets import QTreeView, QWidget
 
 
@@ -25,6 +32,15 @@ class TreeView(QTreeView):
 
         self._placeholderText: str = None
 
+        # The placeholder text with its glyphs laid out for the width stored
+        # along with it, so repaints don't shape and wrap the text again.
+        self._placeholderStaticText = QStaticText()
+        self._placeholderStaticText.setTextFormat(Qt.TextFormat.PlainText)
+        self._placeholderStaticText.setTextOption(
+            QTextOption(Qt.AlignmentFlag.AlignHCenter)
+        )
+        self._placeholderWidth: Optional[int] = None
+
     def setPlaceholderText(self, text: str) -> None:
         """Set a placeholder text.
 
@@ -35,6 +51,8 @@ class TreeView(QTreeView):
         """
 
         self._placeholderText = text
+        self._placeholderStaticText.setText(text)
+        self._placeholderWidth = None
 
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         """Override from QTreeView."""
@@ -45,28 +63,41 @@ class TreeView(QTreeView):
 
         super().mouseDoubleClickEvent(event)
 
+    def changeEvent(self, event: QEvent) -> None:
+        """Override from QTreeView."""
+
+        if event.type() == QEvent.Type.FontChange:
+            self._placeholderWidth = None
+
+        super().changeEvent(event)
+
     def paintEvent(self, event: QPaintEvent) -> None:
         """Override form QTreeView."""
 
         super().paintEvent(event)
-        if self._placeholderText:
-            self._drawPlaceholderText(self._placeholderText)
+        if not self._placeholderText:
+            return
 
-    def _drawPlaceholderText(self, text: str) -> None:
-        """Helper function to draw the placeholder text if the underlying
-        model has no items to display.
+        # The placeholder text is only drawn if the model has no items to
+        # display, which is checked before anything is set up for drawing.
+        model = self.model()
+        if model is None or model.rowCount(self.rootIndex()) == 0:
+            self._drawPlaceholderText()
 
-        Args:
-            text (str): The text to render.
-        """
+    def _drawPlaceholderText(self) -> None:
+        """Helper function to draw the placeholder text."""
 
-        if self.model() and self.model().rowCount(self.rootIndex()) > 0:
-            return
+        rect = self.rect()
+        staticText = self._placeholderStaticText
+        if rect.width() != self._placeholderWidth:
+            staticText.setTextWidth(rect.width())
+            staticText.prepare(QTransform(), self.font())
+            self._placeholderWidth = rect.width()
+
+        # Static text is positioned by its top left corner. Center the wrapped
+        # lines vertically.
+        top = rect.top() + (rect.height() - staticText.size().height()) / 2
 
         painter = QPainter(self.viewport())
         painter.setPen(Qt.GlobalColor.darkGray)
-        painter.drawText(
-            self.rect(),
-            Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap,
-            text,
-        )
+        painter.drawStaticText(QPointF(rect.left(), top), staticText)
@@ -13,6 +13,10 @@ class DockService:
         super().__init__()
         self._registry = DocksRegistry()
 
+        # The dictionary of the registry is updated in place, so lookups can
+        # use it directly.
+        self._docks = self._registry.registrables()
+
     def registry(self) -> DocksRegistry:
         """Get the DocksRegistry containing the available Docks in the service.
 
@@ -41,7 +45,7 @@ class DockService:
             BaseDock. The dock corresponding to the ID, None if not found.
         """
 
-        return self._registry.registrables().get(id, None)
+        return self._docks.get(id, None)
 
     def docks(self) -> dict[str, BaseDock]:
         """Get the dictionary of registered dock widgets.
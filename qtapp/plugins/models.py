@@ -1,10 +1,31 @@
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable
 
 from PySide6.QtCore import QModelIndex, Qt
 
 from qtapp.common.models import ItemTableModel
 from qtapp.plugins.schemas import Module
 
+# Enum members resolved once, as views query them for every visible cell.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_CHECK_STATE_ROLE = Qt.ItemDataRole.CheckStateRole
+_CHECKED = Qt.CheckState.Checked
+_UNCHECKED = Qt.CheckState.Unchecked
+
+# The flags of the cells, which only depend on the column.
+_NO_FLAGS = Qt.ItemFlag.NoItemFlags
+_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+_CHECKABLE_FLAGS = _FLAGS | Qt.ItemFlag.ItemIsUserCheckable
+
+# Functions returning the data of a Module by role and column. Views call data
+# for every visible cell on each repaint, so the data is looked up at once
+# instead of checking the role and the column one after another.
+_DATA: dict[tuple[int, int], Callable[[Module], Any]] = {
+    (_DISPLAY_ROLE, 0): attrgetter("displayName"),
+    (_DISPLAY_ROLE, 1): attrgetter("description"),
+    (_CHECK_STATE_ROLE, 0): lambda module: _CHECKED if module.enabled else _UNCHECKED,
+}
+
 
 class ModuleListModel(ItemTableModel[Module]):
     def __init__(self):
@@ -20,20 +41,9 @@ class ModuleListModel(ItemTableModel[Module]):
         if not index.isValid():
             return None
 
-        module: Module = self.items[index.row()]
-        if role == Qt.ItemDataRole.CheckStateRole:
-            if index.column() == 0:
-                return (
-                    Qt.CheckState.Checked if module.enabled else Qt.CheckState.Unchecked
-                )
-
-        if role == Qt.ItemDataRole.DisplayRole:
-            match index.column():
-                case 0:
-                    return module.displayName
-                case 1:
-                    return module.description
-            return None
+        getter = _DATA.get((role, index.column()), None)
+        if getter is not None:
+            return getter(self._items[index.row()])
 
         return super().data(index, role)
 
@@ -46,10 +56,13 @@ class ModuleListModel(ItemTableModel[Module]):
         """Override from ItemTableModel."""
 
         if index.column() == 0:
-            if role == Qt.ItemDataRole.CheckStateRole:
-                module = self.items[index.row()]
+            if role == _CHECK_STATE_ROLE:
+                module = self._items[index.row()]
                 module.enabled = bool(value)
-                self.dataChanged.emit(index, index)
+
+                # Only the check state of the cell changed, so views don't
+                # have to query the other roles again.
+                self.dataChanged.emit(index, index, [_CHECK_STATE_ROLE])
                 return True
 
         return super().setData(index, value, role)
@@ -58,10 +71,6 @@ class ModuleListModel(ItemTableModel[Module]):
         """Override from ItemTableModel."""
 
         if not index.isValid():
-            return Qt.ItemFlag.NoItemFlags
-
-        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-        if index.column() == 0:
-            flags |= Qt.ItemFlag.ItemIsUserCheckable
+            return _NO_FLAGS
 
-        return flags
+        return _CHECKABLE_FLAGS if index.column() == 0 else _FLAGS
@@ -3,6 +3,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Self, Union
 
+# Loaded Repositories with the modification time of their file, by class and
+# resolved file path.
+_repositoryCache: dict[tuple[type, Path], tuple[int, "Repository"]] = {}
+
 
 @dataclass(frozen=True)
 class ModuleMetadata:
@@ -23,6 +27,10 @@ class Repository:
     def loadFromFile(cls, path: Union[str, Path]) -> Self:
         """Load and create a Repository from the provided json file.
 
+        Repositories are cached by their file. As long as the file isn't
+        modified, loading it again returns the same Repository without
+        reading the file.
+
         Args:
             path (Untion[str, Path]): Path to the Repository file.
 
@@ -31,16 +39,25 @@ class Repository:
         """
 
         path = Path(path).resolve()
-        with open(path, "r", encoding="utf-8") as file:
-            jsonData: list[dict[str, Any]] = json.load(file)
+        modified = path.stat().st_mtime_ns
+        cached = _repositoryCache.get((cls, path), None)
+        if cached is not None and cached[0] == modified:
+            return cached[1]
+
+        # Parse the bytes of the file at once. json.loads detects the UTF
+        # encoding itself, so the file doesn't have to be decoded through a
+        # text stream first.
+        jsonData: list[dict[str, Any]] = json.loads(path.read_bytes())
 
         # Create ModuleMetadata from this Repository.
         modulesMetadata = [ModuleMetadata(**obj) for obj in jsonData]
 
-        return cls(
+        repository = cls(
             path=path.parent,
             modulesMetadata=modulesMetadata,
         )
+        _repositoryCache[(cls, path)] = (modified, repository)
+        return repository
 
 
 class Module:
@@ -53,6 +70,10 @@ class Module:
             or not.
     """
 
+    # Every Module of every Repository is kept in memory, so the instances
+    # don't carry a __dict__.
+    __slots__ = ("_id", "_displayName", "_description", "_path", "_enabled")
+
     def __init__(self, dirPath: Path, metadata: ModuleMetadata):
         self._id = metadata.id
         self._displayName = metadata.displayName
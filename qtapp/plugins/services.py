@@ -1,3 +1,5 @@
+import bisect
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -20,12 +22,30 @@ class PluginService(QObject):
         # Holds all available Plugins.
         self._registry = PluginRegistry()
 
+        # The dictionary of the registry is updated in place, so lookups can
+        # use it directly.
+        self._plugins = self._registry.registrables()
+
+        # Holds all available Plugins sorted by their priority.
+        self._orderedPlugins: list[BasePlugin] = []
+        self.registry.registrableAdded.connect(self._onPluginAdded)
+        self.registry.registrableRemoved.connect(self._orderedPlugins.remove)
+
         # Model which holds all Modules from all repositories.
         self._moduleListModel = ModuleListModel()
 
-        self.registry.registrableAdded.connect(
-            lambda plugin: self.pluginAdded.emit(plugin)
-        )
+        # The enabled Modules, collected on first access after the Modules or
+        # their enabled status changed.
+        self._enabledModules: Optional[list[Module]] = None
+        for signal in (
+            self._moduleListModel.dataChanged,
+            self._moduleListModel.rowsInserted,
+            self._moduleListModel.rowsRemoved,
+            self._moduleListModel.rowsMoved,
+            self._moduleListModel.layoutChanged,
+            self._moduleListModel.modelReset,
+        ):
+            signal.connect(self._invalidateEnabledModules)
 
     @property
     def registry(self) -> PluginRegistry:
@@ -45,12 +65,23 @@ class PluginService(QObject):
     def enabledModules(self) -> list[Module]:
         """Get IDs of all currently enabled Module.
 
+        The list is cached until the Modules change, so it must not be
+        modified.
+
         Returns:
             list[str]: List of IDs of currently enabled Modules.
         """
 
-        moduleList = self.moduleListModel.items
-        return [module for module in moduleList if module.enabled]
+        if self._enabledModules is None:
+            moduleList = self.moduleListModel.items
+            self._enabledModules = [module for module in moduleList if module.enabled]
+
+        return self._enabledModules
+
+    def _invalidateEnabledModules(self) -> None:
+        """Slot triggered when the Modules or their enabled status change."""
+
+        self._enabledModules = None
 
     def load(self, repositoryFiles: list[Path], moduleIds: list[str]) -> None:
         for repositoryFile in repositoryFiles:
@@ -62,18 +93,21 @@ class PluginService(QObject):
                 self.addPluginsFromModule(module)
 
     def addModulesFromRepository(self, repository: Repository) -> None:
-        for metadata in repository.modulesMetadata:
-            module = Module(repository.path, metadata)
-            self.addModule(module)
+        self._moduleListModel.appendItems(
+            [
+                Module(repository.path, metadata)
+                for metadata in repository.modulesMetadata
+            ]
+        )
 
     def addModule(self, module: Module) -> None:
         self._moduleListModel.appendItem(module)
 
     def addPluginsFromModule(self, module: Module) -> None:
         module.enabled = True
+        self._invalidateEnabledModules()
         plugins: list[BasePlugin] = RegistrableLoader.load(module.path, BasePlugin)
-        for plugin in plugins:
-            self.addPlugin(plugin)
+        self._registry.add(plugins)
 
     def addPlugin(self, plugin: BasePlugin) -> None:
         self._registry.add(plugin)
@@ -88,7 +122,32 @@ class PluginService(QObject):
             BasePlugin: The Plugin corresponding to the ID, None if not found.
         """
 
-        return self._registry.registrable(id)
+        return self._plugins.get(id, None)
+
+    def orderedPlugins(self) -> list[BasePlugin]:
+        """Retrieve all registered Plugins sorted by their priority.
+
+        Plugins with the same priority are kept in loading order.
+
+        Returns:
+            list[BasePlugin]: A copy of the list of all registered Plugins in
+                ascending order of their priority value.
+        """
+
+        return list(self._orderedPlugins)
+
+    def _onPluginAdded(self, plugin: BasePlugin) -> None:
+        """Slot triggered when a Plugin is added to the PluginRegistry.
+
+        Relays the Plugin through the pluginAdded Signal after it was sorted
+        into the ordered Plugins.
+
+        Args:
+            plugin (BasePlugin): The added Plugin.
+        """
+
+        bisect.insort(self._orderedPlugins, plugin, key=attrgetter("priority"))
+        self.pluginAdded.emit(plugin)
 
     def plugins(self) -> dict[str, BasePlugin]:
         """Retrieve all registered Plugins.
@@ -25,19 +25,17 @@ class EnabledExtensionsSetting(BaseSetting):
     def writeList(self, enabled_modules: list[str]):
         """Write the enabled module IDs to the settings file.
 
+        The IDs are written as a single list value. An array of IDs written
+        by previous versions is removed.
+
         Args:
             enabled_modules (list[str]): The list of enabled module IDs.
         """
 
         settings = self._settingService.internal
-        size = len(enabled_modules)
-        settings.beginWriteArray(self.id, size)
-
-        for i in range(size):
-            settings.setArrayIndex(i)
-            settings.setValue("id", enabled_modules[i])
-
-        settings.endArray()
+        settings.remove(self.id)
+        settings.setValue(self.id, list(enabled_modules))
+        self._settingService.invalidate(self.id)
 
     def readList(self) -> list[str]:
         """Read enabled module IDs from the settings file.
@@ -47,6 +45,17 @@ class EnabledExtensionsSetting(BaseSetting):
         """
 
         settings = self._settingService.internal
+        if settings.contains(self.id):
+            # QSettings reads a list with a single entry back as a string and
+            # an empty list back as None.
+            value = settings.value(self.id)
+            if value is None:
+                return []
+            if isinstance(value, str):
+                return [value]
+            return list(value)
+
+        # Fall back to the array written by previous versions.
         size = settings.beginReadArray(self.id)
 
         enabled_modules: list[str] = []
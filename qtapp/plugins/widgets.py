@@ -52,6 +52,11 @@ class ExtensionManagerDialog(QDialog):
         self._app = app
 
         self._model = self._app.pluginService.moduleListModel
+
+        # The IDs of the enabled modules when they were last written, so the
+        # settings are only written if modules were toggled.
+        self._enabledIds = self._currentEnabledIds()
+
         self.setupUi()
 
     def setupUi(self) -> None:
@@ -79,11 +84,22 @@ class ExtensionManagerDialog(QDialog):
     def closeEvent(self, event: QCloseEvent) -> None:
         """Override from QMainWindow."""
 
-        enabledModulesSetting: EnabledExtensionsSetting = (
-            self._app.settingService.setting(EnabledExtensionsSetting.id)
-        )
-        enabledModulesSetting.writeList(
-            [module.id for module in self._app.pluginService.enabledModules]
-        )
-        self._app.settingService.forceWrite()
+        enabledIds = self._currentEnabledIds()
+        if enabledIds != self._enabledIds:
+            enabledModulesSetting: EnabledExtensionsSetting = (
+                self._app.settingService.setting(EnabledExtensionsSetting.id)
+            )
+            enabledModulesSetting.writeList(list(enabledIds))
+            self._app.settingService.forceWrite()
+            self._enabledIds = enabledIds
+
         event.accept()
+
+    def _currentEnabledIds(self) -> tuple[str, ...]:
+        """Get the IDs of the currently enabled modules.
+
+        Returns:
+            tuple[str, ...]: The IDs of the enabled modules.
+        """
+
+        return tuple(module.id for module in self._app.pluginService.enabledModules)
@@ -1,12 +1,17 @@
 from pathlib import Path
-from typing import Any, Optional, Union
+from types import ModuleType
+from typing import Any, Callable, Optional, Union
 
-from PySide6.QtCore import QObject, QSettings, Signal
+from PySide6.QtCore import QObject, QSettings, QThreadPool, Signal, Slot
 
 from qtapp.utils.registrable import RegistrableLoader
+from qtapp.utils.worker import Worker
 
 from . import BaseSetting, SettingsRegistry
 
+# Marks a value missing from the cache, as None is a valid value.
+_MISSING = object()
+
 
 class SettingService(QObject):
     """Service for managing application settings."""
@@ -23,6 +28,15 @@ class SettingService(QObject):
         # Holds all available Settings
         self._registry = SettingsRegistry()
 
+        # The dictionary of the registry is updated in place, so lookups can
+        # use it directly.
+        self._settings = self._registry.registrables()
+
+        # Values read from the QSettings by key and type. A value is cached
+        # until it is set again through the service. Missing keys aren't
+        # cached, so their default value is always returned.
+        self._values: dict[tuple[str, Any], Any] = {}
+
         self._setup(organization, application)
 
     def _setup(self, organization: str, application: str) -> None:
@@ -39,8 +53,32 @@ class SettingService(QObject):
 
     @property
     def internal(self) -> QSettings:
+        """Get the underlying QSettings.
+
+        Code writing values to the QSettings directly must call invalidate
+        afterwards.
+
+        Returns:
+            QSettings: The QSettings of the service.
+        """
+
         return self._internal
 
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Notify the service about values written to the QSettings directly.
+
+        The cached values of the changed settings are dropped.
+
+        Args:
+            key (Optional[str]): The key of the changed setting. If None, all
+                cached values are dropped (default = None).
+        """
+
+        if key is None:
+            self._values.clear()
+        else:
+            self._invalidateValues(key)
+
     def addSetting(self, setting: BaseSetting):
         """Add a setting to the registry.
 
@@ -61,7 +99,7 @@ class SettingService(QObject):
                 found.
         """
 
-        return self._registry.registrables().get(id, None)
+        return self._settings.get(id, None)
 
     def settings(self) -> dict[str, BaseSetting]:
         """Retrieve all registered settings.
@@ -83,17 +121,69 @@ class SettingService(QObject):
         settings = RegistrableLoader.load(path, BaseSetting, settingService=self)
         self._registry.add(settings)
 
+    def loadAsync(
+        self,
+        path: Union[str, Path],
+        onFinished: Optional[Callable[[], None]] = None,
+        onError: Optional[Callable[[tuple], None]] = None,
+    ) -> None:
+        """Load settings from a specific path into the SettingsRegistry without
+        blocking the calling thread.
+
+        The modules are read and executed on the global QThreadPool. The
+        settings are created and added in the thread of the service once the
+        modules are loaded, as they are QObjects. The registry notifies about
+        them as usual.
+
+        Args:
+            path (Union[str, Path]): The path to the settings.
+            onFinished (Optional[Callable[[], None]]): Called when loading is
+                finished, whether it succeeded or not (default = None).
+            onError (Optional[Callable[[tuple], None]]): Called with the type,
+                value and formatted traceback of the exception if loading
+                failed (default = None).
+        """
+
+        # All Signals are connected before the Worker is started, so none of
+        # them can be missed.
+        worker = Worker(RegistrableLoader.loadModules, path)
+        worker.signals.result.connect(self._onModulesLoaded)
+        if onError is not None:
+            worker.signals.error.connect(onError)
+        if onFinished is not None:
+            worker.signals.finished.connect(onFinished)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(object)
+    def _onModulesLoaded(self, modules: list[ModuleType]) -> None:
+        """Slot triggered when the modules of loadAsync are loaded."""
+
+        settings = RegistrableLoader.fromModules(
+            modules, BaseSetting, settingService=self
+        )
+        self._registry.add(settings)
+
     def setValue(self, key: str, value: Any):
         """Set the value of a setting.
 
+        Nothing is written and no Signal is emitted if the cached value of the
+        setting is equal to the value and of the same type.
+
         Args:
             key (str): The key of the setting.
             value (Any): The value to be set.
         """
 
+        # Only the cache is checked, reading the QSettings would cost more than
+        # the write. Values of another type are written, e.g. 1 after True.
+        current = self._values.get((key, ...), _MISSING)
+        if type(current) is type(value) and current == value:
+            return
+
         self._internal.setValue(key, value)
+        self._invalidateValues(key)
 
-        setting: BaseSetting = self._registry.registrables().get(key, None)
+        setting: BaseSetting = self._settings.get(key, None)
         if setting is not None:
             setting.dataChanged.emit(value)
 
@@ -106,6 +196,9 @@ class SettingService(QObject):
         """
         Retrieve the value of a setting.
 
+        Values are cached, so reading the same key again doesn't query the
+        QSettings. The cached value is shared, so it must not be modified.
+
         Args:
             key (str): The key of the setting.
             default_value (Optional[Any]): The default value to be returned if
@@ -117,9 +210,105 @@ class SettingService(QObject):
             object: The value of the setting.
         """
 
+        cacheKey = (key, type)
+        value = self._values.get(cacheKey, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        if not self._internal.contains(key):
+            return self._readValue(key, default_value, type)
+
+        value = self._readValue(key, default_value, type)
+        self._values[cacheKey] = value
+        return value
+
+    def _readValue(self, key: str, default_value: Any, type: object) -> object:
+        """Read a value from the QSettings, passing only the given arguments.
+
+        Args:
+            key (str): The key of the setting.
+            default_value (Any): The default value or Ellipsis if not given.
+            type (object): The type of the value or Ellipsis if not given.
+
+        Returns:
+            object: The value of the setting.
+        """
+
+        if type is ...:
+            if default_value is ...:
+                return self._internal.value(key)
+            return self._internal.value(key, default_value)
+
+        if default_value is ...:
+            return self._internal.value(key, type=type)
         return self._internal.value(key, default_value, type)
 
+    def readGroup(
+        self,
+        group: str,
+        types: Optional[dict[str, type]] = None,
+    ) -> dict[str, Any]:
+        """Retrieve the values of all settings within a group at once.
+
+        Args:
+            group (str): The group of the settings, e.g. "application".
+            types (Optional[dict[str, type]]): The types of the values to be
+                returned by their key relative to the group. Values of keys
+                not contained are returned as stored (default = None).
+
+        Returns:
+            dict[str, Any]: The values of the settings by their key relative to
+                the group.
+        """
+
+        types = types or {}
+        values: dict[str, Any] = {}
+
+        self._internal.beginGroup(group)
+        for key in self._internal.childKeys():
+            if key in types:
+                values[key] = self._internal.value(key, None, types[key])
+            else:
+                values[key] = self._internal.value(key)
+        self._internal.endGroup()
+
+        return values
+
+    def writeGroup(self, group: str, values: dict[str, Any]) -> None:
+        """Set the values of multiple settings within a group at once.
+
+        Args:
+            group (str): The group of the settings, e.g. "application".
+            values (dict[str, Any]): The values to be set by their key relative
+                to the group.
+        """
+
+        self._internal.beginGroup(group)
+        for key, value in values.items():
+            self._internal.setValue(key, value)
+        self._internal.endGroup()
+
+        for key in values:
+            self._invalidateValues(f"{group}/{key}")
+
+        for key, value in values.items():
+            setting: BaseSetting = self._settings.get(f"{group}/{key}", None)
+            if setting is not None:
+                setting.dataChanged.emit(value)
+
     def forceWrite(self):
         """Forces the settings to be written to storage."""
 
+        # Syncing also reads changes made by other processes.
         self._internal.sync()
+        self._values.clear()
+
+    def _invalidateValues(self, key: str) -> None:
+        """Remove the cached values of a key for all types.
+
+        Args:
+            key (str): The key of the setting.
+        """
+
+        for cacheKey in [cacheKey for cacheKey in self._values if cacheKey[0] == key]:
+            del self._values[cacheKey]
@@ -1,9 +1,10 @@
+from bisect import bisect_right
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from qtapp.app import BaseApplication
 
-from PySide6.QtCore import QRegularExpression, QRegularExpressionMatch, Qt, Slot
+from PySide6.QtCore import QRegularExpression, QStringListModel, Qt, Slot
 from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import (
     QCompleter,
@@ -20,6 +21,10 @@ from qtapp.settings.services import SettingService
 
 from . import BaseSetting
 
+# Characters with a special meaning in a regular expression. A search text
+# without any of them is matched as a plain substring.
+_REGEX_CHARACTERS = frozenset(".*+?[](){}|^$\\")
+
 
 class _SettingWidget(QWidget):
     def __init__(self, setting: BaseSetting, parent: Optional[QWidget] = None) -> None:
@@ -57,18 +62,35 @@ class SettingsManagerDialog(QDialog):
         super().__init__(parent)
         self._app = app
 
+        # The widgets of the settings sorted by the display names of their
+        # settings, along with the sorted display names. Settings are added
+        # and removed one by one, so the widgets are updated incrementally.
         self._widgets: list[_SettingWidget] = []
+        self._sortedNames: list[str] = []
+        self._foldedNames: list[str] = []
         self._completions: list[str] = []
 
-        registry = self._app.settingService.registry
-        registry.registrableAdded.connect(self._onSettingRegistryChanged)
-        registry.registrableRemoved.connect(self._onSettingRegistryChanged)
-
         self.setupUi()
 
+        # The completions of the existing settings are set at once.
+        settings = self._app.settingService.settings().values()
+        self._completions.extend(
+            setting.displayName
+            for setting in settings
+            if setting.displayName is not None
+        )
+        self._completionModel.setStringList(self._completions)
+        for setting in settings:
+            self._insertWidget(setting)
+
+        registry = self._app.settingService.registry
+        registry.registrableAdded.connect(self._onSettingAdded)
+        registry.registrableRemoved.connect(self._onSettingRemoved)
+
     def setupUi(self) -> None:
         self._paneLayout = QVBoxLayout()
         self._paneLayout.setSpacing(16)
+        self._paneLayout.addStretch()
 
         paneWidget = QWidget()
         paneWidget.setLayout(self._paneLayout)
@@ -81,13 +103,14 @@ class SettingsManagerDialog(QDialog):
         closeBtn = actionBtns.button(QDialogButtonBox.StandardButton.Close)
         closeBtn.clicked.connect(self.close)
 
-        completer = QCompleter(self._completions)
-        completer.setFilterMode(Qt.MatchFlag.MatchContains)
-        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._completionModel = QStringListModel(self._completions, self)
+        self._completer = QCompleter(self._completionModel, self)
+        self._completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        self._completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
 
         self._search = SearchEdit()
         self._search.searchChanged.connect(self._onSearchChanged)
-        self._search.setCompleter(completer)
+        self._search.setCompleter(self._completer)
 
         layout = QVBoxLayout()
         layout.addWidget(self._search)
@@ -100,61 +123,94 @@ class SettingsManagerDialog(QDialog):
         self.setFixedSize(700, 400)
 
     @Slot()
-    def _onSettingRegistryChanged(self, registrable: BaseSetting) -> None:
-        # Don't perform this operation if the registrable doesn't change the
-        # layout.
-        if registrable.displayName is None or registrable.widget() is None:
+    def _onSettingAdded(self, setting: BaseSetting) -> None:
+        """Slot triggered when a setting is added to the SettingsRegistry.
+
+        Inserts the widget of the setting at its sorted position.
+
+        Args:
+            setting (BaseSetting): The added setting.
+        """
+
+        name = setting.displayName
+        if name is None:
             return
 
-        managableSettings = list(
-            filter(
-                lambda s: s.displayName is not None and s.widget() is not None,
-                list(self._app.settingService.settings().values()),
-            )
-        )
+        # The completion is inserted as a new row instead of replacing the
+        # whole string list of the model.
+        row = len(self._completions)
+        self._completions.append(name)
+        self._completionModel.insertRows(row, 1)
+        self._completionModel.setData(self._completionModel.index(row), name)
+
+        self._insertWidget(setting)
 
-        # Sort settings.
-        managableSettings.sort(key=lambda s: s.displayName)
+    def _insertWidget(self, setting: BaseSetting) -> None:
+        """Insert the widget of a setting at its sorted position.
 
-        self._widgets.clear()
-        for setting in managableSettings:
-            self._widgets.append(_SettingWidget(setting))
+        Args:
+            setting (BaseSetting): The setting.
+        """
 
-        # Remove widgets from the pane layout.
-        while self._paneLayout.count():
-            item = self._paneLayout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
+        # Settings without a name or widget can't be changed in the dialog.
+        name = setting.displayName
+        if name is None or setting.widget() is None:
+            return
 
-        # Adding new widgets to the pane layout.
-        for widget in self._widgets:
-            self._paneLayout.addWidget(widget)
+        # Settings with the same display name are kept in the order they were
+        # added. The stretch at the end of the pane stays behind all widgets.
+        index = bisect_right(self._sortedNames, name)
+        widget = _SettingWidget(setting)
+        self._widgets.insert(index, widget)
+        self._sortedNames.insert(index, name)
+        self._foldedNames.insert(index, name.casefold())
+        self._paneLayout.insertWidget(index, widget)
 
-        self._paneLayout.addStretch()
+    @Slot()
+    def _onSettingRemoved(self, setting: BaseSetting) -> None:
+        """Slot triggered when a setting is removed from the SettingsRegistry.
 
-        # Adjust the completions for the completer.
-        self._completions.clear()
-        self._completions.extend(
-            [
-                s.displayName
-                for s in list(self._app.settingService.settings().values())
-                if s.displayName
-            ]
-        )
+        Args:
+            setting (BaseSetting): The removed setting.
+        """
+
+        name = setting.displayName
+        if name is None:
+            return
+
+        row = self._completions.index(name)
+        del self._completions[row]
+        self._completionModel.removeRows(row, 1)
+
+        for index, widget in enumerate(self._widgets):
+            if widget.setting() is setting:
+                del self._widgets[index]
+                del self._sortedNames[index]
+                del self._foldedNames[index]
+                self._paneLayout.takeAt(index)
+                widget.deleteLater()
+                break
 
     @Slot()
     def _onSearchChanged(self, text: str) -> None:
-        regex = QRegularExpression(
-            text,
-            options=QRegularExpression.PatternOption.CaseInsensitiveOption,
-        )
+        # Most searches are plain words, which are matched against the
+        # casefolded names without setting up a regular expression.
+        if _REGEX_CHARACTERS.isdisjoint(text):
+            needle = text.casefold()
+            matches = [needle in name for name in self._foldedNames]
+        else:
+            regex = QRegularExpression(
+                text,
+                options=QRegularExpression.PatternOption.CaseInsensitiveOption,
+            )
+            matches = [
+                regex.match(widget.setting().displayName).hasMatch()
+                for widget in self._widgets
+            ]
 
         self._paneLayout.parentWidget().setUpdatesEnabled(False)
-        for widget in self._widgets:
-            regexMatch: QRegularExpressionMatch = regex.match(
-                widget.setting().displayName
-            )
-            widget.setVisible(regexMatch.hasMatch())
+        for widget, match in zip(self._widgets, matches):
+            widget.setVisible(match)
         self._paneLayout.parentWidget().setUpdatesEnabled(True)
 
     def closeEvent(self, event: QCloseEvent) -> None:
@@ -1,5 +1,8 @@
+import math
 from pathlib import Path
-from PySide6.QtCore import QFile, QTextStream
+
+_UNITS = ("", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei", "Zi", "Yi")
+
 
 def formatBytes(num: float, suffix: str = "B") -> str:
     """Format a number of bytes into readable formats.
@@ -15,17 +18,31 @@ def formatBytes(num: float, suffix: str = "B") -> str:
             Examples: "1.2 KiB", "3.5 MiB", "500 B", etc.
     """
 
-    for unit in ["", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei", "Zi"]:
-        if abs(num) < 1024.0:
-            return f"{num:3.1f} {unit}{suffix}"
-        num /= 1024.0
-    return f"{num:.1f} Yi{suffix}"
+    # The unit is the number of whole powers of 1024 in the integral part,
+    # which can be read from its bit length.
+    num = float(num)
+    size = abs(num)
+    index = 0
+    if not size < 1024.0:
+        if math.isfinite(size):
+            index = min((int(size).bit_length() - 1) // 10, len(_UNITS) - 1)
+        else:
+            index = len(_UNITS) - 1
+        num /= 1 << (10 * index)
+
+    if index == len(_UNITS) - 1:
+        return f"{num:.1f} {_UNITS[index]}{suffix}"
+    return f"{num:3.1f} {_UNITS[index]}{suffix}"
 
 
 def readFileContent(path: Path) -> str:
-    file = QFile(path)
-    file.open(QFile.OpenModeFlag.ReadOnly)
-    stream = QTextStream(file)
-    content = stream.readAll()
-    file.close()
-    return content
+    """Read the content of a text file.
+
+    Args:
+        path (Path): The path to the UTF-8 encoded file.
+
+    Returns:
+        str: The content of the file.
+    """
+
+    return Path(path).read_text(encoding="utf-8")
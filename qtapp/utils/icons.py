@@ -0,0 +1,84 @@
+from functools import lru_cache
+from typing import Any
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QIcon
+
+_MODES = (
+    QIcon.Mode.Normal,
+    QIcon.Mode.Disabled,
+    QIcon.Mode.Active,
+    QIcon.Mode.Selected,
+)
+_STATES = (QIcon.State.Off, QIcon.State.On)
+
+
+def icon(name: str, **options: Any) -> QIcon:
+    """Get a qtawesome icon.
+
+    Rendering a qtawesome icon is expensive and widgets often request the
+    same icons, so the icons are cached. QIcon is implicitly shared, so the
+    same icon can safely be used by multiple widgets.
+
+    Args:
+        name (str): The name of the icon, e.g. "ph.x-light".
+        **options (Any): The options of the icon, e.g. color="grey". The
+            values must be hashable.
+
+    Returns:
+        QIcon: The icon.
+    """
+
+    return _icon(name, tuple(sorted(options.items())))
+
+
+def pixmapIcon(name: str, size: QSize, **options: Any) -> QIcon:
+    """Get a qtawesome icon rendered in advance for a fixed size.
+
+    A qtawesome icon renders its glyph again whenever a pixmap of it is
+    requested, e.g. on every repaint of a button. For widgets that show an
+    icon at a fixed size, the glyph is rendered once for every mode and state
+    and the resulting pixmaps are reused.
+
+    Args:
+        name (str): The name of the icon, e.g. "ph.x-light".
+        size (QSize): The size the icon is shown at.
+        **options (Any): The options of the icon, e.g. color="grey". The
+            values must be hashable.
+
+    Returns:
+        QIcon: The icon.
+    """
+
+    return _pixmapIcon(
+        name, size.width(), size.height(), tuple(sorted(options.items()))
+    )
+
+
+@lru_cache(maxsize=256)
+def _icon(name: str, options: tuple[tuple[str, Any], ...]) -> QIcon:
+    # qtawesome loads and registers its icon fonts on import. Import it on
+    # the first icon request, so importing the widgets stays cheap.
+    import qtawesome as qta
+
+    return qta.icon(name, **dict(options))
+
+
+@lru_cache(maxsize=256)
+def _pixmapIcon(
+    name: str,
+    width: int,
+    height: int,
+    options: tuple[tuple[str, Any], ...],
+) -> QIcon:
+    # The pixmaps can't be added to the qtawesome icon itself, as its engine
+    # ignores added pixmaps.
+    source = _icon(name, options)
+    size = QSize(width, height)
+
+    icon = QIcon()
+    for mode in _MODES:
+        for state in _STATES:
+            icon.addPixmap(source.pixmap(size, mode, state), mode, state)
+
+    return icon
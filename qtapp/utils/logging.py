@@ -1,32 +1,86 @@
 import logging
+import threading
+from typing import Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QMetaObject, QObject, Qt, Signal, Slot
 
 logger = logging.getLogger("qtapp")
 
 
+_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_COLORS = {
+    logging.DEBUG: "black",
+    logging.INFO: "black",
+    logging.WARNING: "orange",
+    logging.ERROR: "red",
+    logging.CRITICAL: "red",
+}
+
+
 class GuiLoggingFormatter(logging.Formatter):
-    format = "%(asctime)s [%(levelname)s] %(message)s"
-
-    _formats = {
-        logging.DEBUG: f'<span style="color: black;">{format}</span>',
-        logging.INFO: f'<span style="color: black;">{format}</span>',
-        logging.WARNING: f'<span style="color: orange;">{format}</span>',
-        logging.ERROR: f'<span style="color: red;">{format}</span>',
-        logging.CRITICAL: f'<span style="color: red;">{format}</span>',
+    # One Formatter per level, so no Formatter is created for each record.
+    _formatters = {
+        level: logging.Formatter(
+            f'<span style="color: {color};">{_FORMAT}</span>', datefmt=_DATE_FORMAT
+        )
+        for level, color in _COLORS.items()
     }
 
     def format(self, record):
-        logFmt = self._formats.get(record.levelno)
-        formatter = logging.Formatter(logFmt, datefmt="%Y-%m-%d %H:%M:%S")
+        formatter = self._formatters.get(record.levelno, None)
+        if formatter is None:
+            formatter = self._formatters[logging.INFO]
         return formatter.format(record)
 
 
 class GuiStream(QObject):
     textWritten = Signal(str)
 
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+
+        # Streams write a line in several fragments. The fragments are
+        # buffered and emitted at once when a line is complete or, for an
+        # incomplete line, once control returns to the event loop. Writes may
+        # come from any thread, so the buffer is guarded by a lock.
+        self._buffer: list[str] = []
+        self._flushPending = False
+        self._lock = threading.Lock()
+
     def flush(self):
-        pass
+        self._flush()
 
     def write(self, text):
-        self.textWritten.emit(str(text))
+        text = str(text)
+        if not text:
+            return
+
+        with self._lock:
+            self._buffer.append(text)
+            if "\n" not in text:
+                if not self._flushPending:
+                    self._flushPending = True
+                    QMetaObject.invokeMethod(
+                        self, "_flush", Qt.ConnectionType.QueuedConnection
+                    )
+                return
+
+            buffered = "".join(self._buffer)
+            self._buffer.clear()
+
+        self.textWritten.emit(buffered)
+
+    @Slot()
+    def _flush(self) -> None:
+        """Emit the buffered text of an incomplete line."""
+
+        with self._lock:
+            self._flushPending = False
+            if not self._buffer:
+                return
+
+            buffered = "".join(self._buffer)
+            self._buffer.clear()
+
+        self.textWritten.emit(buffered)
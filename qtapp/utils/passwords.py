@@ -3,6 +3,8 @@ import string
 from enum import IntEnum
 from typing import Optional
 
+_random = secrets.SystemRandom()
+
 
 class PasswordGenerator:
     class CharacterSet(IntEnum):
@@ -24,9 +26,9 @@ class PasswordGenerator:
         digits = string.digits
         specials = string.punctuation
 
-        allCharacters = []
+        allCharacters = ""
 
-        # Ensure at least on character from each set is included
+        # Ensure at least one character from each set is included.
         password = []
         if isSet(charSet, PasswordGenerator.CharacterSet.LETTERS):
             allCharacters += letters
@@ -36,12 +38,28 @@ class PasswordGenerator:
             password.append(secrets.choice(digits))
         if isSet(charSet, PasswordGenerator.CharacterSet.SPECIALS):
             allCharacters += specials
-            secrets.choice(specials)
+            password.append(secrets.choice(specials))
+
+        # Fill the rest of the password with random characters. Random bytes
+        # are drawn in bulk instead of one choice per character. Bytes beyond
+        # the largest multiple of the number of characters are rejected, so
+        # every character is equally likely.
+        missing = length - 3
+        if missing > 0 and not allCharacters:
+            # The same error as choosing from the empty pool one by one.
+            raise IndexError("Cannot choose from an empty sequence")
 
-        # Fill the rest of the password with random characters.
-        password.extend(secrets.choice(allCharacters) for _ in range(length - 3))
+        count = len(allCharacters)
+        limit = 256 - 256 % count if count else 0
+        while missing > 0:
+            for byte in secrets.token_bytes(max(missing * 2, 32)):
+                if byte < limit:
+                    password.append(allCharacters[byte % count])
+                    missing -= 1
+                    if missing == 0:
+                        break
 
-        # Shuffle the password to randomize the order
-        secrets.SystemRandom().shuffle(password)
+        # Shuffle the password to randomize the order.
+        _random.shuffle(password)
 
         return "".join(password)
@@ -1,12 +1,27 @@
+import os
+import threading
+import weakref
 from importlib import util
 from pathlib import Path
 from types import ModuleType
-from typing import Optional, TypeVar
+from typing import Iterable, Optional, TypeVar
 
 from PySide6.QtCore import QObject, Signal
 
 from qtapp.exceptions import RegistrableAlreadyExistsError, RegistrableNotFoundError
 
+# Modules loaded from files with the modification time of their file, by real
+# path. Executing the same file again would define all its classes once more,
+# so a file is only executed again if it was modified. Modules may be loaded
+# on worker threads, so the cache is guarded by a lock. The lock is reentrant,
+# as a module may load other modules while it is executed.
+_moduleCache: dict[str, tuple[int, ModuleType]] = {}
+_moduleCacheLock = threading.RLock()
+
+# The classes of each loaded module, so a cached module isn't scanned again.
+# Modules that are no longer referenced drop out.
+_moduleClassesCache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
 class Registrable(QObject):
     """Base class for objects that can be registered in a Registry.
@@ -27,43 +42,119 @@ T = TypeVar("T", bound=Registrable)
 class RegistrableLoader:
 
     @staticmethod
-    def _loadRegistrablesFromModule(
-        module: Path, class_: T, *args, **kwargs
-    ) -> list[T]:
-        """Load an instance of each Registrable of type class_ from the
-        specified module into memory.
+    def invalidate(path: str | Path) -> None:
+        """Forget the loaded modules of a file or directory, so that they are
+        executed again when they are loaded the next time.
+
+        Args:
+            path (Union[str, Path]): The path to the module file or the
+                directory containing the module files.
+        """
+
+        realPath = os.path.realpath(path)
+        prefix = os.path.join(realPath, "")
+        with _moduleCacheLock:
+            for modulePath in list(_moduleCache):
+                if modulePath == realPath or modulePath.startswith(prefix):
+                    del _moduleCache[modulePath]
+
+    @staticmethod
+    def _loadModuleFile(module: Path) -> ModuleType:
+        """Load the specified module file into memory.
+
+        The file must be a valid module.
 
         Args:
             module (Path): The path to the module containing the Registrables
                 objects to load.
-            class_ (Type[T]): The class type of the Registrables to load from
-                the module.
 
         Returns:
-            list[T]: A list of instances loaded from the module.
+            ModuleType: The loaded module.
 
         Raises:
             FileNotFoundError: If the specified module file is not found.
             Exception: If any other error occurs while loading the module file.
         """
 
-        if not _isValidModule(module.name, module.suffix):
-            return []
+        try:
+            return _loadModule(module.stem, str(module))
+        except FileNotFoundError as err:
+            raise err
+        except Exception as err:
+            raise err
+
+    @staticmethod
+    def loadModules(path: str | Path) -> list[ModuleType]:
+        """Load all modules from the specified path (modules and all
+        submodules) without instanciating their Registrables.
+
+        No Registrable is created, so this can run on a worker thread. The
+        Registrables are QObjects and have to be created by fromModules in
+        the thread they are used in.
+
+        Args:
+            path (Union[str, Path]): The path to the file or directory
+                containing the modules.
+
+        Returns:
+            list[ModuleType]: A list of the modules and submodules found in the
+                specific path.
 
+        Raises:
+            FileNotFoundError: If the specified path is not found.
+            PermissionError: If permission is denied while accessing the
+                specified path.
+            Exception: If any other error occurs while loading a module.
+        """
+
+        path = Path(path)
+        modules: list[ModuleType] = []
         try:
-            module = _loadModule(module.stem, str(module))
+            if path.is_dir():
+                # The entries of os.scandir know whether they are directories
+                # from reading the directory, so no entry has to be queried
+                # separately in most cases. Only valid modules become Paths.
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            modules.extend(RegistrableLoader.loadModules(entry.path))
+                        elif _isValidModule(entry.name):
+                            modules.append(
+                                RegistrableLoader._loadModuleFile(Path(entry.path))
+                            )
+            elif _isValidModule(path.name):
+                modules.append(RegistrableLoader._loadModuleFile(path))
         except FileNotFoundError as err:
             raise err
+        except PermissionError as err:
+            raise err
         except Exception as err:
             raise err
 
-        registrables: list[T] = []
-        for _, obj in module.__dict__.items():
-            if isinstance(obj, type) and issubclass(obj, class_) and obj != class_:
-                registrable: T = obj(*args, **kwargs)
-                registrables.append(registrable)
+        return modules
+
+    @staticmethod
+    def fromModules(
+        modules: Iterable[ModuleType], class_: T, *args, **kwargs
+    ) -> list[T]:
+        """Instanciate each Registrable of type class_ from the specified
+        modules.
+
+        Args:
+            modules (Iterable[ModuleType]): The modules loaded by loadModules.
+            class_ (Type[T]): The class type of the Registrables to load from
+                the modules.
+
+        Returns:
+            list[T]: A list of instances created from the modules.
+        """
 
-        return registrables
+        return [
+            obj(*args, **kwargs)
+            for module in modules
+            for obj in _moduleClasses(module)
+            if issubclass(obj, class_) and obj != class_
+        ]
 
     @staticmethod
     def load(path: str | Path, class_: T, *args, **kwargs) -> list[T]:
@@ -90,41 +181,8 @@ class RegistrableLoader:
                 instanciate the Registrable.
         """
 
-        path = Path(path)
-        registrables: list[T] = []
-        try:
-            if path.is_dir():
-                for itemFile in path.iterdir():
-                    if itemFile.is_dir():
-                        registrables.extend(
-                            RegistrableLoader.load(itemFile, class_, *args, **kwargs)
-                        )
-                    else:
-                        registrables.extend(
-                            RegistrableLoader._loadRegistrablesFromModule(
-                                itemFile,
-                                class_,
-                                *args,
-                                **kwargs,
-                            )
-                        )
-            else:
-                registrables.extend(
-                    RegistrableLoader._loadRegistrablesFromModule(
-                        path,
-                        class_,
-                        *args,
-                        **kwargs,
-                    )
-                )
-        except FileNotFoundError as err:
-            raise err
-        except PermissionError as err:
-            raise err
-        except Exception as err:
-            raise err
-
-        return registrables
+        modules = RegistrableLoader.loadModules(path)
+        return RegistrableLoader.fromModules(modules, class_, *args, **kwargs)
 
 
 class BaseRegistry(QObject):
@@ -177,6 +235,9 @@ class BaseRegistry(QObject):
     def add(self, registrable: T | list[T]) -> None:
         """Add a Registrable or list of Registrables to the Registry.
 
+        A list of Registrables is added as a whole. If any of them already
+        exists, none of them is added.
+
         Args:
             registrable (T | list[T]): The Registrable or list of Registrables
                 to add to the Registry.
@@ -186,8 +247,17 @@ class BaseRegistry(QObject):
                 Registry.
         """
         if isinstance(registrable, list):
+            # Check all Registrables first, including duplicates within the
+            # list, so that the Registry isn't left partially updated.
+            ids = {r.id for r in registrable}
+            if len(ids) != len(registrable) or not ids.isdisjoint(
+                self._registrables
+            ):
+                raise RegistrableAlreadyExistsError()
+
+            self._registrables.update({r.id: r for r in registrable})
             for r in registrable:
-                self.add(r)
+                self.registrableAdded.emit(r)
         else:
             if self._registrables.get(registrable.id) is not None:
                 raise RegistrableAlreadyExistsError()
@@ -217,6 +287,29 @@ class BaseRegistry(QObject):
                 self.registrableRemoved.emit(registrable)
 
 
+def _moduleClasses(module: ModuleType) -> list[type]:
+    """Get the classes of a module which can be Registrables.
+
+    All classes defined or imported in the module are candidates.
+
+    Args:
+        module (ModuleType): The module.
+
+    Returns:
+        list[type]: The classes of the module.
+    """
+
+    with _moduleCacheLock:
+        classes = _moduleClassesCache.get(module, None)
+        if classes is None:
+            classes = [
+                obj for obj in module.__dict__.values() if isinstance(obj, type)
+            ]
+            _moduleClassesCache[module] = classes
+
+    return classes
+
+
 def _loadModule(name: str, path: str) -> ModuleType:
     """Load a Python module from a specific file path.
 
@@ -232,28 +325,38 @@ def _loadModule(name: str, path: str) -> ModuleType:
         Exception: If any other error occurs while loading the module.
     """
 
-    try:
-        spec = util.spec_from_file_location(name, path)
-        module = util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-    except FileNotFoundError as err:
-        raise err
-    except Exception as err:
-        # Catch any exception that can occur by loading the module.
-        raise err
+    # A file that was loaded before isn't executed again unless it was
+    # modified. The lock is held while the module is executed, so concurrent
+    # loads of the same file execute it only once.
+    realPath = os.path.realpath(path)
+    with _moduleCacheLock:
+        modified = os.stat(realPath).st_mtime_ns
+        cached = _moduleCache.get(realPath, None)
+        if cached is not None and cached[0] == modified:
+            return cached[1]
+
+        try:
+            spec = util.spec_from_file_location(name, path)
+            module = util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except FileNotFoundError as err:
+            raise err
+        except Exception as err:
+            # Catch any exception that can occur by loading the module.
+            raise err
 
-    return module
+        _moduleCache[realPath] = (modified, module)
+        return module
 
 
-def _isValidModule(modname: str, ext: str) -> bool:
-    """Check if the given module has a valid module name.
+def _isValidModule(fileName: str) -> bool:
+    """Check if the given file name is the name of a valid module.
 
     Args:
-        modname (str): The module name.
-        ext (str): The file extension.
+        fileName (str): The file name including the extension.
 
     Returns:
         bool: True if the module name is valid, False otherwise.
     """
 
-    return ext == ".py" and not modname.startswith(".")
+    return fileName.endswith(".py") and not fileName.startswith(".")
@@ -2,8 +2,10 @@ def singleton(cls):
     instances = {}
 
     def get_instance(*args, **kwargs):
-        if cls not in list(instances.keys()):
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        try:
+            return instances[cls]
+        except KeyError:
+            instance = instances[cls] = cls(*args, **kwargs)
+            return instance
 
     return get_instance